@@ -5,7 +5,10 @@ Uses yt-dlp for downloading and searching YouTube content.
 
 import os
 import re
-import concurrent.futures
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Optional, Any
 
 from utils.models import (
@@ -16,6 +19,182 @@ from utils.models import (
 )
 from .youtube_api import YouTubeAPI, parse_youtube_url
 
+# Optional: pyahocorasick gives a single-pass prescan of titles for tag literals
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Tags to remove from video titles (case insensitive)
+# We match these inside (), [], {}, ||, -, ., /, •, +
+_TITLE_TAGS = [
+    # Video & Visual
+    r"Official Video", r"Official Music Video", r"Official Lyric Video",
+    r"Music Video", r"Lyric Video", r"Video Oficial", r"Videoclip Oficial",
+    r"Official", r"Video", r"Pseudo Video", r"Visualizer", r"VISUALIZER",
+    r"Official HD Video", r"Official 4K Video", r"Premiere", r"Visualizer Video",
+    r"Official CantoYo Video", r"Official Video HD", r"Official Trailer",
+    r"M/V", r"Cover Audio Video", r"Remastered Video", r"Acoustic Video",
+    r"Offical Video", r"Visualiser", r"Animated Lyric Video",
+    r"Official Video Remastered HD", r"Lyrics / Lyric Video",
+    r"Official Live Video", r"Official Classic Version", r"Animated Video",
+    r"Official Video 2016", r"Official Video 2021", r"Official Video HQ",
+    r"Official Music Vidéo", r"VIDEO OFFICIAL", r"Official Vedio",
+    r"\*\*OFFICIAL VIDEO\*\*", r"Pop-up Video",
+
+    # Audio & Stream
+    r"Audio", r"Official Audio", r"Audio Stream", r"Official Full Stream",
+    r"Cover Art", r"Audio Only", r"Audio Officiel", r"Audio Oficial",
+
+    # Quality & Technical
+    r"HD", r"4K Remaster", r"Remastered \d+", r"Full HD Remastered",
+    r"Best Quality", r"Ultra High Quality", r"60fps", r"98 BPM_G major",
+    r"Stereo", r"HQ \+ Lyrics", r"HQ", r"HQ Remaster", r"wmv", r"30sec",
+    r"720P", r"1080P", r"flv", r"mov", r"Full Version HD", r"in 4K",
+    r"HQ HD Dirty", r"HD Widescreen Music Video",
+
+    # Content & Metadata
+    r"Explicit", r"UNCENSORED", r"Lyrics", r"Free", r"w/ Lyrics",
+    r"Ultra Music", r"Spinnin Records", r"OUT NOW", r"OUT NOW!",
+    r"YHLQMDLG", r"TopPop", r"LYRICS!!", r"Ringtone Download",
+    r"New Single", r"English", r"FREE DOWNLOAD", r"LYRICS",
+    r"with lyrics", r"with download link", r"DOWNLOAD AVAILABLE!",
+    r"Original", r"original", r"Full Length", r"FULL", r"Lyrics Video",
+    r"CDQ", r"New/CDQ/Dirty", r"on ITUNES NOW", r"Original Radio",
+    r"Out Now!", r"DVD Cut", r"Lyriclizer", r"Official Version",
+    r"WSHH Exclusive", r"WSHH Premiere", r"CLIPE OFICIAL",
+    r"non-official recut", r"Dirty", r"Videoclip"
+]
+
+# Matches: ( [ { | - . / • +  tag  +  ) ] } | - . / • + or EndOfString
+# Compiled once at import; _clean_title runs for every track of a playlist/channel
+_TAGS_RE = re.compile(
+    r'\s*[\(\[\|\{\-\.\/•\+]\s*(?:' + '|'.join(_TITLE_TAGS) + r')\s*(?:[\)\]\|\}\-\.\/•\+]|\s*$)',
+    re.IGNORECASE
+)
+# Match # followed by word characters, remove from first hashtag to end
+_HASHTAG_RE = re.compile(r'\s*#\w+.*$')
+_WS_RE = re.compile(r'\s+')
+# yt-dlp upload_date format
+_YYYYMMDD_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+
+# Download format and codec per global quality tier
+# Mapping: HIFI/LOSSLESS -> opus, HIGH/MEDIUM -> aac, LOW/MINIMUM -> mp3
+_QUALITY_TABLE = {
+    QualityEnum.HIFI: ('opus', CodecEnum.OPUS),
+    QualityEnum.LOSSLESS: ('opus', CodecEnum.OPUS),
+    QualityEnum.HIGH: ('aac', CodecEnum.AAC),
+    QualityEnum.MEDIUM: ('aac', CodecEnum.AAC),
+    QualityEnum.LOW: ('mp3', CodecEnum.MP3),
+    QualityEnum.MINIMUM: ('mp3', CodecEnum.MP3),
+}
+_DEFAULT_QUALITY = ('opus', CodecEnum.OPUS)
+
+# Watch page URL for a video ID
+_WATCH_URL_FMT = 'https://www.youtube.com/watch?v={}'.format
+# Fixed fields of the TrackInfo returned when a video can't be loaded
+_ERROR_TRACK_KWARGS = dict(
+    name='Unknown',
+    album='YouTube',
+    album_id='',
+    codec=CodecEnum.OPUS,
+    cover_url='',
+    release_year=2024,
+    error='Failed to get video information',
+    sample_rate=48.0,
+)
+# Max number of video info dicts (without formats) kept in memory per interface
+_VIDEO_INFO_CACHE_SIZE = 3000
+# Formats lists are large (100+ signed URLs), so only the most recent ones are kept, for previews
+_VIDEO_FORMATS_CACHE_SIZE = 50
+# Stream URLs in formats expire after a few hours; older cached formats are fetched again
+_VIDEO_INFO_FORMATS_MAX_AGE = 3600
+# Bulky info dict keys left out of the in-memory video info cache (formats are kept separately)
+_VIDEO_INFO_DROPPED_KEYS = frozenset(('formats', 'requested_formats', 'requested_downloads', 'automatic_captions', 'subtitles', 'heatmap'))
+# On-disk video metadata cache (relative to app root, like the default cookies path)
+_METADATA_CACHE_PATH = './config/youtube-metadata-cache.sqlite3'
+# "Artist - Title" separators recognised by _parse_title_artist
+_TITLE_SEPARATORS = (' - ', ' : ', ' – ')
+
+_TAG_OPENERS = frozenset('([|{-./•+')
+_TAG_CLOSERS = frozenset(')]|}-./•+')
+
+
+def _build_tag_automaton():
+    """Build an Aho-Corasick automaton over the literal form of each tag.
+    Values are (literal length, whether digits follow, e.g. 'Remastered \\d+')."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for tag in _TITLE_TAGS:
+        needs_digits = tag.endswith(r'\d+')
+        literal = tag[:-3] if needs_digits else tag
+        literal = re.sub(r'\\(.)', r'\1', literal).casefold()
+        automaton.add_word(literal, (len(literal), needs_digits))
+    automaton.make_automaton()
+    return automaton
+
+
+_TAG_AUTOMATON = _build_tag_automaton()
+
+
+def _title_may_have_tags(title: str) -> bool:
+    """
+    Cheap single-pass check whether _TAGS_RE can match anywhere in the title.
+    Finds every tag literal with Aho-Corasick, then validates the opener before and
+    the closer/end after each hit. Only errs on the side of True, so the regex
+    (which keeps the exact removal semantics) still runs whenever it could match.
+    """
+    # Most titles have no opener at all; a set check in C rules them out without any scan
+    if _TAG_OPENERS.isdisjoint(title):
+        return False
+    if _TAG_AUTOMATON is None:
+        return True
+    folded = title.casefold()
+    if len(folded) != len(title):
+        # Case folding changed character offsets; let the regex decide
+        return True
+    n = len(folded)
+    for end, (tag_len, needs_digits) in _TAG_AUTOMATON.iter(folded):
+        # Left side: optional whitespace, then an opener
+        i = end - tag_len
+        while i >= 0 and folded[i].isspace():
+            i -= 1
+        if i < 0 or folded[i] not in _TAG_OPENERS:
+            continue
+        # Right side: digits if required, optional whitespace, then a closer or end of string
+        j = end + 1
+        if needs_digits:
+            if j >= n or not folded[j].isdigit():
+                continue
+            while j < n and folded[j].isdigit():
+                j += 1
+        while j < n and folded[j].isspace():
+            j += 1
+        if j == n or folded[j] in _TAG_CLOSERS:
+            return True
+    return False
+
+
+# Parsed OrpheusDL settings.json per path as (mtime, data); shared by all interface instances
+_SETTINGS_CACHE: Dict[str, tuple] = {}
+
+
+def _load_global_settings(settings_path: str) -> Dict[str, Any]:
+    """Return the parsed settings.json, only re-reading it when its mtime changes. {} if missing."""
+    try:
+        mtime = os.stat(settings_path).st_mtime
+    except OSError:
+        return {}
+    cached = _SETTINGS_CACHE.get(settings_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(settings_path, 'r') as f:
+        all_settings = json.load(f)
+    _SETTINGS_CACHE[settings_path] = (mtime, all_settings)
+    return all_settings
+
 
 module_information = ModuleInformation(
     service_name='YouTube',
@@ -24,6 +203,9 @@ module_information = ModuleInformation(
         'cookies_path': './config/youtube-cookies.txt',
         'download_pause_seconds': 5,
         'download_mode': 'sequential',
+        'prefetch_metadata': False,
+        'use_aria2c': False,
+        'cache_ttl_hours': 24,
     },
     global_settings={},
     netlocation_constant=['youtube', 'youtu.be'],
@@ -40,40 +222,132 @@ class ModuleInterface:
         settings = module_controller.module_settings
         
         # Get cookies path from settings
-        cookies_path = settings.get('cookies_path', '')
-        if not cookies_path:
-            cookies_path = './config/youtube-cookies.txt'
-            
-        if cookies_path and not os.path.isabs(cookies_path):
-            if cookies_path.startswith('./') or cookies_path.startswith('.\\'):
+        cookies_path = settings.get('cookies_path') or './config/youtube-cookies.txt'
+        if not os.path.isabs(cookies_path):
+            if cookies_path.startswith(('./', '.\\')):
                 # Relative to app root (CWD)
                 cookies_path = os.path.abspath(cookies_path)
             else:
                 # Make relative paths relative to config directory (legacy behavior)
-                config_dir = os.path.join(module_controller.data_folder, '..', 'config')
-                cookies_path = os.path.join(config_dir, cookies_path)
+                cookies_path = os.path.abspath(os.path.join(module_controller.data_folder, '..', 'config', cookies_path))
         
         # Get FFmpeg path from global settings
         ffmpeg_path = None
         if module_controller.orpheus_options:
             # Try to get FFmpeg path from OrpheusDL settings
             try:
-                import json
                 settings_path = os.path.join(module_controller.data_folder, '..', 'config', 'settings.json')
-                if os.path.isfile(settings_path):
-                    with open(settings_path, 'r') as f:
-                        all_settings = json.load(f)
-                        ffmpeg_path = all_settings.get('global', {}).get('advanced', {}).get('ffmpeg_path')
+                all_settings = _load_global_settings(settings_path)
+                ffmpeg_path = all_settings.get('global', {}).get('advanced', {}).get('ffmpeg_path')
             except Exception:
                 pass
         
+        # Metadata persisted across runs by YouTubeAPI; cache_ttl_hours 0 disables it. Videos are kept
+        # for the full TTL; playlists, channel listings and searches for at most 6h/1h/1h of it
+        try:
+            cache_ttl_hours = float(settings.get('cache_ttl_hours', 24))
+        except (TypeError, ValueError):
+            cache_ttl_hours = 24
+        cache_ttl = max(cache_ttl_hours, 0) * 3600
+        
         self.api = YouTubeAPI(
             cookies_path=cookies_path,
             ffmpeg_path=ffmpeg_path,
-            sleep_interval=settings.get('download_pause_seconds', 5)
+            sleep_interval=settings.get('download_pause_seconds', 5),
+            use_aria2c=bool(settings.get('use_aria2c', False)),
+            cache_path=os.path.abspath(_METADATA_CACHE_PATH) if cache_ttl else None,
+            cache_ttl_video=cache_ttl,
+            # Playlists change more often than videos or channels
+            cache_ttl_playlist=min(cache_ttl, 6 * 3600),
+            # Channel listings gain new uploads; keep them short like search
+            cache_ttl_channel=min(cache_ttl, 3600),
+            # Search rankings drift; an hour covers re-running the same search in a session
+            cache_ttl_search=min(cache_ttl, 3600)
         )
         
-
+        # Video info by ID, so preview + download of the same track only fetch once
+        self._video_info_cache: OrderedDict = OrderedDict()
+        # Formats of recently fetched videos by ID as (fetched_at, formats)
+        self._video_formats_cache: OrderedDict = OrderedDict()
+        self._video_info_lock = threading.Lock()
+        self.prefetch_metadata = bool(settings.get('prefetch_metadata', False))
+        
+    def _get_video_info(self, track_id: str, need_formats: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get full video info from the in-memory LRU caches, fetching it on a miss. need_formats
+        also needs formats fetched less than _VIDEO_INFO_FORMATS_MAX_AGE ago.
+        """
+        with self._video_info_lock:
+            video_data = self._video_info_cache.get(track_id)
+            if video_data is not None:
+                if not need_formats:
+                    self._video_info_cache.move_to_end(track_id)
+                    return video_data
+                fetched_at, formats = self._video_formats_cache.pop(track_id, (0, None))
+                if formats is not None and time.monotonic() - fetched_at < _VIDEO_INFO_FORMATS_MAX_AGE:
+                    self._video_formats_cache[track_id] = (fetched_at, formats)
+                    self._video_info_cache.move_to_end(track_id)
+                    return {**video_data, 'formats': formats}
+        
+        video_data = self.api.get_video_info(track_id, use_cache=not need_formats)
+        if video_data:
+            self._cache_video_info(track_id, video_data)
+        return video_data
+    
+    def _cache_video_info(self, track_id: str, video_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep video_data, minus its bulky keys, in the LRU cache and return what was kept.
+        Its formats go to the much smaller formats cache."""
+        kept = {k: v for k, v in video_data.items() if k not in _VIDEO_INFO_DROPPED_KEYS}
+        formats = video_data.get('formats')
+        with self._video_info_lock:
+            self._video_info_cache[track_id] = kept
+            self._video_info_cache.move_to_end(track_id)
+            if len(self._video_info_cache) > _VIDEO_INFO_CACHE_SIZE:
+                self._video_info_cache.popitem(last=False)
+            if formats:
+                self._video_formats_cache[track_id] = (time.monotonic(), formats)
+                self._video_formats_cache.move_to_end(track_id)
+                if len(self._video_formats_cache) > _VIDEO_FORMATS_CACHE_SIZE:
+                    self._video_formats_cache.popitem(last=False)
+        return kept
+    
+    def _get_video_info_batch(self, track_ids: List[str], metadata_only: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get full video info for many tracks. Cache misses are fetched in parallel by the API,
+        whose worker threads each reuse one YoutubeDL instance; metadata_only fetches them
+        without formats (see YouTubeAPI.get_video_info).
+        Tracks that failed to load are left out of the result.
+        """
+        found = {}
+        missing = []
+        with self._video_info_lock:
+            for tid in track_ids:
+                video_data = self._video_info_cache.get(tid)
+                if video_data is not None:
+                    found[tid] = video_data
+                else:
+                    missing.append(tid)
+        
+        if missing:
+            # I/O bound: threads overlap the network round-trips
+            for tid, video_data in zip(missing, self.api.get_video_info_batch(missing, max_workers=8, use_cache=True, metadata_only=metadata_only)):
+                if video_data:
+                    found[tid] = self._cache_video_info(tid, video_data)
+        return found
+    
+    def _prefetch_video_info(self, track_ids: List[str], track_data: Dict[str, Dict]):
+        """Swap full video info into track_data when prefetch_metadata is enabled,
+        so the per-track get_track_info calls that follow don't hit yt-dlp one by one."""
+        if not self.prefetch_metadata or not track_ids:
+            return
+        track_data.update(self._get_video_info_batch(track_ids))
+    
+    def clear_cache(self):
+        """Drop all cached video info, in memory and on disk."""
+        with self._video_info_lock:
+            self._video_info_cache.clear()
+            self._video_formats_cache.clear()
+        self.api.clear_cache()
         
     def custom_url_parse(self, link: str) -> Optional[MediaIdentification]:
         """Parse YouTube URL and determine media type."""
@@ -130,73 +404,49 @@ class ModuleInterface:
             s = str(upload_date)
             return s[:4] if len(s) >= 4 else None
 
-        def _name_for_result(result):
-            return result.get('title', 'Unknown')
-
-        def _channel_or_artist_for_result(result):
-            # Prefer channel/uploader name for the artist column
-            return result.get('uploader') or result.get('channel')
-
         def _artists_for_result(result):
             # Show the channel/uploader in the Artist column for playlists if available.
             # If not available (common for YouTube playlist searches), return empty to keep column blank.
-            name = _channel_or_artist_for_result(result)
+            name = result.get('uploader') or result.get('channel')
             if not name or name.strip() == 'Unknown':
                 return []
             return [name]
 
-        def _additional_for_result(result):
-            if query_type != DownloadTypeEnum.playlist:
-                return None
+        def _playlist_additional(result):
             n = result.get('playlist_count')
             if n is None:
                 return None
             return [f"1 track" if n == 1 else f"{n} tracks"]
 
-        def _skip_playlist_no_tracks(result):
-            if query_type != DownloadTypeEnum.playlist:
-                return False
-            # Only hide playlists that explicitly have 0 entries; show when count is missing (yt-dlp may omit it in search)
-            n = result.get('playlist_count')
-            return n is not None and n == 0
+        # Decide the per-type behaviour once, not for every result
+        is_playlist = query_type == DownloadTypeEnum.playlist
 
         out = [
             SearchResult(
                 result_id=result['id'],
-                name=_name_for_result(result),
+                name=result.get('title', 'Unknown'),
                 artists=_artists_for_result(result) or None,
                 duration=result.get('duration'),
                 year=_year_from_upload_date(result.get('upload_date')),
-                additional=_additional_for_result(result),
+                additional=_playlist_additional(result) if is_playlist else None,
                 image_url=result.get('thumbnail'),
                 extra_kwargs={'data': {result['id']: result}}
             )
             for result in results
-            if not _skip_playlist_no_tracks(result)
+            # Only hide playlists that explicitly have 0 entries; show when count is missing (yt-dlp may omit it in search)
+            if not (is_playlist and result.get('playlist_count') == 0)
         ]
 
         if query_type == DownloadTypeEnum.track:
             missing_years = [t for t in out if not t.year]
             if missing_years:
-                import yt_dlp
-                vdts = {}
-                def _fetch_yt_date(tid):
-                    ydl_opts = {'quiet': True, 'extract_flat': True, 'nocheckcertificate': True, 'cachedir': False}
-                    try:
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            res = ydl.extract_info(tid, download=False)
-                            y = _year_from_upload_date(res.get('upload_date') or res.get('release_date'))
-                            if y: return tid, y
-                    except: pass
-                    return tid, None
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                    for tid, y in executor.map(_fetch_yt_date, [t.result_id for t in missing_years]):
-                        if y: vdts[tid] = y
-                
+                # Only upload_date is needed: skip format resolution. Through the shared video info cache,
+                # so showing a result's track info doesn't fetch it again (previews still fetch formats)
+                infos = self._get_video_info_batch([t.result_id for t in missing_years], metadata_only=True)
                 for t in missing_years:
-                    if t.result_id in vdts:
-                        t.year = vdts[t.result_id]
+                    res = infos.get(t.result_id)
+                    if res:
+                        t.year = _year_from_upload_date(res.get('upload_date') or res.get('release_date')) or t.year
         
         elif query_type == DownloadTypeEnum.playlist:
             missing_artists = [t for t in out if not t.artists]
@@ -205,54 +455,49 @@ class ModuleInterface:
             missing_durations = [t for t in out if not t.duration]
             
             if missing_artists or missing_years or missing_tracks or missing_durations:
-                import yt_dlp
                 vups = {}
                 vdts = {}
                 vtcs = {}
                 vdurs = {}
-                def _fetch_yt_playlist_meta(tid):
-                    ydl_opts = {'quiet': True, 'extract_flat': True, 'nocheckcertificate': True, 'cachedir': False}
-                    try:
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            url = f"https://www.youtube.com/playlist?list={tid}"
-                            res = ydl.extract_info(url, download=False)
-                            name = res.get('uploader') or res.get('channel')
-                            
-                            # Fallback 1: Use modified_date if available (fastest for playlists)
-                            y = _year_from_upload_date(res.get('upload_date') or res.get('release_date') or res.get('modified_date'))
-                            
-                            entries = res.get('entries', [])
-                            duration = None
+                def _playlist_meta(res):
+                    name = res.get('uploader') or res.get('channel')
+                    
+                    # Fallback 1: Use modified_date if available (fastest for playlists)
+                    y = _year_from_upload_date(res.get('upload_date') or res.get('release_date') or res.get('modified_date'))
+                    
+                    entries = res.get('entries') or []
+                    duration = None
+                    
+                    if entries:
+                        # Process duration
+                        durations = [e.get('duration') for e in entries if isinstance(e, dict)]
+                        sum_dur = sum((d for d in durations if d), 0)
+                        if sum_dur > 0:
+                            duration = sum_dur
+
+                    # Fallback 2: Extract the earliest upload_date from its constituent video entries
+                    if not y:
+                        dates = [_year_from_upload_date(e.get('upload_date') or e.get('release_date')) for e in entries if isinstance(e, dict)]
+                        valid_dates = [d for d in dates if d]
+                        if valid_dates:
+                            y = min(valid_dates)
                             
-                            if entries:
-                                # Process duration
-                                durations = [e.get('duration') for e in entries if isinstance(e, dict)]
-                                sum_dur = sum((d for d in durations if d), 0)
-                                if sum_dur > 0:
-                                    duration = sum_dur
-
-                            # Fallback 2: Extract the earliest upload_date from its constituent video entries
-                            if not y:
-                                dates = [_year_from_upload_date(e.get('upload_date') or e.get('release_date')) for e in entries if isinstance(e, dict)]
-                                valid_dates = [d for d in dates if d]
-                                if valid_dates:
-                                    y = min(valid_dates)
-                                    
-                            track_count = res.get('playlist_count')
-                            if not track_count and entries:
-                                track_count = len(entries)
-                                
-                            return tid, name, y, track_count, duration
-                    except: pass
-                    return tid, None, None, None, None
+                    track_count = res.get('playlist_count')
+                    if not track_count and entries:
+                        track_count = len(entries)
+                        
+                    return name, y, track_count, duration
 
                 target_ids = list(set([t.result_id for t in missing_artists] + [t.result_id for t in missing_years] + [t.result_id for t in missing_tracks] + [t.result_id for t in missing_durations]))
-                with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                    for tid, name, y, tc, dur in executor.map(_fetch_yt_playlist_meta, target_ids):
-                        if name: vups[tid] = name
-                        if y: vdts[tid] = y
-                        if tc: vtcs[tid] = tc
-                        if dur: vdurs[tid] = dur
+                # Cached flat playlist info, shared with opening the playlist afterwards
+                for tid, res in zip(target_ids, self.api.get_playlist_info_batch(target_ids, max_workers=5)):
+                    if not res:
+                        continue
+                    name, y, tc, dur = _playlist_meta(res)
+                    if name: vups[tid] = name
+                    if y: vdts[tid] = y
+                    if tc: vtcs[tid] = tc
+                    if dur: vdurs[tid] = dur
                 
                 for t in out:
                     if not t.artists and t.result_id in vups:
@@ -272,20 +517,27 @@ class ModuleInterface:
         Attempt to extract artist and title from the video title.
         Returns (artist, title).
         """
-        # Regex to match "Artist - Title" patterns (handling hyphen, en-dash, colon)
-        # We look for a separator surrounded by whitespace
-        match = re.search(r"^(?P<artist>.+?)\s+[-:–]\s+(?P<title>.+)$", title)
-        
-        if match:
-            extracted_artist = match.group('artist').strip()
-            extracted_title = match.group('title').strip()
+        # Find the leftmost "Artist - Title" separator (hyphen, colon, en-dash surrounded by spaces).
+        # Titles are whitespace-collapsed by _clean_title, so a str.find per separator is enough
+        sep_idx, sep_len = -1, 0
+        for sep in _TITLE_SEPARATORS:
+            idx = title.find(sep, 1)
+            if idx != -1 and (sep_idx == -1 or idx < sep_idx):
+                sep_idx, sep_len = idx, len(sep)
+        
+        if sep_idx != -1:
+            extracted_artist = title[:sep_idx].strip()
+            extracted_title = title[sep_idx + sep_len:].strip()
             
             # Check if the extracted artist is related to the uploader
             # This prevents false positives where the title structure mimics "Artist - Title" but isn't
             # e.g. "Review - Some Product" where uploader is "TechReviewer"
             # But we want to catch "Anne-Marie" in "Anne-Marie - Alarm" where uploader is "Anne-Marie"
-            if uploader.lower() in extracted_artist.lower() or extracted_artist.lower() in uploader.lower():
-                return extracted_artist, extracted_title
+            if extracted_title:
+                uploader_cf = uploader.casefold()
+                artist_cf = extracted_artist.casefold()
+                if uploader_cf in artist_cf or artist_cf in uploader_cf:
+                    return extracted_artist, extracted_title
                 
         # Fallback: use uploader as artist and original title
         return uploader, title
@@ -298,66 +550,20 @@ class ModuleInterface:
         title = title.replace('–', '-')
         
         # Step 2: Remove hashtags and everything after them
-        # Match # followed by word characters, remove from first hashtag to end
-        title = re.sub(r'\s*#\w+.*$', '', title)
-        
-        # List of tags to remove (case insensitive)
-        # We match these inside (), [], {}, ||, -, ., /, •, +
-        tags = [
-            # Video & Visual
-            r"Official Video", r"Official Music Video", r"Official Lyric Video",
-            r"Music Video", r"Lyric Video", r"Video Oficial", r"Videoclip Oficial",
-            r"Official", r"Video", r"Pseudo Video", r"Visualizer", r"VISUALIZER",
-            r"Official HD Video", r"Official 4K Video", r"Premiere", r"Visualizer Video",
-            r"Official CantoYo Video", r"Official Video HD", r"Official Trailer",
-            r"M/V", r"Cover Audio Video", r"Remastered Video", r"Acoustic Video",
-            r"Offical Video", r"Visualiser", r"Animated Lyric Video",
-            r"Official Video Remastered HD", r"Lyrics / Lyric Video",
-            r"Official Live Video", r"Official Classic Version", r"Animated Video",
-            r"Official Video 2016", r"Official Video 2021", r"Official Video HQ",
-            r"Official Music Vidéo", r"VIDEO OFFICIAL", r"Official Vedio",
-            r"\*\*OFFICIAL VIDEO\*\*", r"Pop-up Video",
-            
-            # Audio & Stream
-            r"Audio", r"Official Audio", r"Audio Stream", r"Official Full Stream",
-            r"Cover Art", r"Audio Only", r"Audio Officiel", r"Audio Oficial",
-            
-            # Quality & Technical
-            r"HD", r"4K Remaster", r"Remastered \d+", r"Full HD Remastered",
-            r"Best Quality", r"Ultra High Quality", r"60fps", r"98 BPM_G major",
-            r"Stereo", r"HQ \+ Lyrics", r"HQ", r"HQ Remaster", r"wmv", r"30sec",
-            r"720P", r"1080P", r"flv", r"mov", r"Full Version HD", r"in 4K",
-            r"HQ HD Dirty", r"HD Widescreen Music Video",
-            
-            # Content & Metadata
-            r"Explicit", r"UNCENSORED", r"Lyrics", r"Free", r"w/ Lyrics",
-            r"Ultra Music", r"Spinnin Records", r"OUT NOW", r"OUT NOW!",
-            r"YHLQMDLG", r"TopPop", r"LYRICS!!", r"Ringtone Download",
-            r"New Single", r"English", r"FREE DOWNLOAD", r"LYRICS",
-            r"with lyrics", r"with download link", r"DOWNLOAD AVAILABLE!",
-            r"Original", r"original", r"Full Length", r"FULL", r"Lyrics Video",
-            r"CDQ", r"New/CDQ/Dirty", r"on ITUNES NOW", r"Original Radio",
-            r"Out Now!", r"DVD Cut", r"Lyriclizer", r"Official Version",
-            r"WSHH Exclusive", r"WSHH Premiere", r"CLIPE OFICIAL",
-            r"non-official recut", r"Dirty", r"Videoclip"
-        ]
+        title = _HASHTAG_RE.sub('', title)
         
-        # Construct regex pattern
-        # Matches: ( [ { | - . / • +  tag  +  ) ] } | - . / • + or EndOfString
-        # We use non-capturing groups for the tags joined by |
-        tags_pattern = '|'.join(tags)
-        pattern = r'\s*[\(\[\|\{\-\.\/•\+]\s*(' + tags_pattern + r')\s*(?:[\)\]\|\}\-\.\/•\+]|\s*$)'
-        
-        # Remove matches, ignoring case
-        clean_title = re.sub(pattern, '', title, flags=re.IGNORECASE)
+        # Remove bracketed/delimited tags, ignoring case
+        # The prescan skips the big alternation for titles that contain no delimited tag
+        clean_title = _TAGS_RE.sub('', title) if _title_may_have_tags(title) else title
         
         # Clean up extra whitespace
-        clean_title = re.sub(r'\s+', ' ', clean_title).strip()
+        clean_title = _WS_RE.sub(' ', clean_title).strip()
         
         return clean_title
 
     def get_track_info(self, track_id: str, quality_tier: QualityEnum, codec_options: CodecOptions, data: Dict = None, **kwargs):
         """Get information about a YouTube video."""
+        preview_url = _WATCH_URL_FMT(track_id) if track_id else None
         
         # Get video info from cache or API
         video_data = None
@@ -365,35 +571,27 @@ class ModuleInterface:
             video_data = data[track_id]
         
         if not video_data:
-            video_data = self.api.get_video_info(track_id)
+            video_data = self._get_video_info(track_id)
         
         if not video_data:
+            # Mutable fields (artists, tags) are created per track so callers can't share them
             return TrackInfo(
-                name='Unknown',
-                album='YouTube',
-                album_id='',
+                **_ERROR_TRACK_KWARGS,
                 artists=['Unknown'],
                 tags=Tags(),
-                codec=CodecEnum.OPUS,
-                cover_url='',
-                release_year=2024,
-                error='Failed to get video information',
                 id=track_id,
-                sample_rate=48.0,
-                preview_url=f"https://www.youtube.com/watch?v={track_id}" if track_id else None,
+                preview_url=preview_url,
             )
         
         # Extract metadata
-        raw_title = video_data.get('title', 'Unknown') or 'Unknown'
+        g = video_data.get
+        raw_title = g('title', 'Unknown') or 'Unknown'
         
         # Clean title tags
         raw_title = self._clean_title(raw_title)
         
-        raw_uploader = video_data.get('uploader', video_data.get('channel', 'Unknown')) or 'Unknown'
-        
         # Remove " - Topic" suffix from uploader if present
-        if raw_uploader and raw_uploader.endswith(' - Topic'):
-            raw_uploader = raw_uploader[:-8]
+        raw_uploader = (g('uploader') or g('channel') or 'Unknown').removesuffix(' - Topic')
         
         # Fallback to channel name if uploader is unknown
         if (raw_uploader == 'Unknown' or not raw_uploader) and kwargs.get('channel_name'):
@@ -403,51 +601,38 @@ class ModuleInterface:
         # e.g. if title is "Anne-Marie - Alarm" and uploader is "Anne-Marie", we want artist="Anne-Marie", title="Alarm"
         # instead of artist="Anne-Marie", title="Anne-Marie - Alarm"
         uploader, title = self._parse_title_artist(raw_title, raw_uploader)
-        duration = video_data.get('duration')
-        thumbnail = video_data.get('thumbnail')
-        upload_date = video_data.get('upload_date', '')
+        duration = g('duration')
+        thumbnail = g('thumbnail')
+        description = g('description')
+        upload_date = g('upload_date', '')
         
         # Parse upload date (format: YYYYMMDD)
         release_year = 2024
         release_date = None
-        if upload_date and len(upload_date) >= 4:
-            try:
+        if upload_date:
+            m = _YYYYMMDD_RE.fullmatch(upload_date)
+            if m:
+                year, month, day = m.groups()
+                release_year = int(year)
+                release_date = f"{year}-{month}-{day}"
+            elif len(upload_date) >= 4 and upload_date[:4].isdecimal():
                 release_year = int(upload_date[:4])
-                if len(upload_date) == 8:
-                    release_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-            except ValueError:
-                pass
         
         # Best available thumbnail
-        thumbnails = video_data.get('thumbnails', [])
+        thumbnails = g('thumbnails', [])
         if thumbnails:
-            # Get highest quality thumbnail
-            best_thumb = max(thumbnails, key=lambda t: t.get('width', 0) * t.get('height', 0))
+            # Get highest quality thumbnail (first with the largest area) in a single pass
+            best_thumb, best_area = thumbnails[0], -1
+            for t in thumbnails:
+                area = (t.get('width') or 0) * (t.get('height') or 0)
+                if area > best_area:
+                    best_thumb, best_area = t, area
             thumbnail = best_thumb.get('url', thumbnail)
         
         # Determine codec/format based on quality_tier (from global settings)
         # This allows the right-click context menu to override preferred_format
-        # Mapping: HIFI -> opus, HIGH -> aac, LOW/MEDIUM/MINIMUM -> mp3
-        quality_to_format = {
-            QualityEnum.HIFI: 'opus',
-            QualityEnum.LOSSLESS: 'opus',
-            QualityEnum.HIGH: 'aac',
-            QualityEnum.MEDIUM: 'aac',
-            QualityEnum.LOW: 'mp3',
-            QualityEnum.MINIMUM: 'mp3',
-        }
-        
         # Use quality_tier to determine format, fallback to opus
-        selected_format = quality_to_format.get(quality_tier, 'opus')
-        
-        if selected_format == 'opus':
-            codec = CodecEnum.OPUS
-        elif selected_format == 'aac' or selected_format == 'm4a':
-            codec = CodecEnum.AAC
-        elif selected_format == 'mp3':
-            codec = CodecEnum.MP3
-        else:
-            codec = CodecEnum.OPUS
+        selected_format, codec = _QUALITY_TABLE.get(quality_tier, _DEFAULT_QUALITY)
         
         # YouTube delivers OPUS/MP3 (and typically AAC) at 48kHz; display matches actual output
         sample_rate = 48.0
@@ -456,11 +641,11 @@ class ModuleInterface:
             album='YouTube',
             album_id='youtube',
             artists=[uploader],
-            artist_id=video_data.get('channel_id', ''),
+            artist_id=g('channel_id', ''),
             tags=Tags(
                 release_date=release_date,
                 genres=['YouTube'],
-                description=video_data.get('description', '')[:500] if video_data.get('description') else None,
+                description=description[:500] if description else None,
             ),
             codec=codec,
             cover_url=thumbnail or '',
@@ -468,7 +653,7 @@ class ModuleInterface:
             duration=duration,
             id=track_id,
             sample_rate=sample_rate,
-            preview_url=f"https://www.youtube.com/watch?v={track_id}" if track_id else None,
+            preview_url=preview_url,
             download_extra_kwargs={
                 'video_id': track_id,
                 'video_data': video_data,
@@ -512,6 +697,20 @@ class ModuleInterface:
             different_codec=codec
         )
     
+    def _collect_tracks(self, entries: List[Dict]) -> tuple[List[str], Dict[str, Dict]]:
+        """Video IDs (in order) and entry data by ID from flat playlist/channel entries, in one pass."""
+        track_ids = []
+        track_data = {}
+        for entry in entries:
+            if not entry:
+                continue
+            entry_id = entry.get('id')
+            if not entry_id:
+                continue
+            track_ids.append(entry_id)
+            track_data[entry_id] = entry
+        return track_ids, track_data
+    
     def get_playlist_info(self, playlist_id: str, data: Dict = None, **kwargs):
         """Get information about a YouTube playlist."""
         
@@ -536,18 +735,23 @@ class ModuleInterface:
         
         # Extract video IDs
         entries = playlist_data.get('entries', [])
-        track_ids = [entry['id'] for entry in entries if entry and entry.get('id')]
-        track_data = {entry['id']: entry for entry in entries if entry and entry.get('id')}
-        
+        track_ids, track_data = self._collect_tracks(entries)
+        self._prefetch_video_info(track_ids, track_data)
+        
+        creator = playlist_data.get('uploader') or playlist_data.get('channel') or 'Unknown'
+        # Playlists without their own thumbnail use the first video's
+        cover_url = playlist_data.get('thumbnail')
+        if not cover_url and entries and entries[0]:
+            cover_url = entries[0].get('thumbnail')
         return PlaylistInfo(
             name=playlist_data.get('title', 'Unknown Playlist'),
-            creator=playlist_data.get('uploader', playlist_data.get('channel', 'Unknown')),
+            creator=creator,
             creator_id=playlist_data.get('channel_id', ''),
             tracks=track_ids,
             release_year=2024,
-            cover_url=playlist_data.get('thumbnail', ''),
+            cover_url=cover_url or '',
             description=playlist_data.get('description', ''),
-            track_extra_kwargs={'data': track_data, 'channel_name': playlist_data.get('uploader', playlist_data.get('channel', 'Unknown'))}
+            track_extra_kwargs={'data': track_data, 'channel_name': creator}
         )
     
     def get_album_info(self, album_id: str, data: Dict = None, **kwargs):
@@ -573,10 +777,10 @@ class ModuleInterface:
         
         # Extract video IDs
         entries = channel_data.get('entries', [])
-        track_ids = [entry['id'] for entry in entries if entry and entry.get('id')]
-        track_data = {entry['id']: entry for entry in entries if entry and entry.get('id')}
+        track_ids, track_data = self._collect_tracks(entries)
+        self._prefetch_video_info(track_ids, track_data)
         
-        channel_name = channel_data.get('title', channel_data.get('uploader', 'Unknown'))
+        channel_name = channel_data.get('title') or channel_data.get('uploader') or 'Unknown'
         return ArtistInfo(
             name=channel_name,
             artist_id=artist_id,
@@ -594,7 +798,7 @@ class ModuleInterface:
         """
         try:
             # Use yt-dlp to extract format information and get a low-quality audio stream URL
-            video_info = self.api.get_video_info(track_id)
+            video_info = self._get_video_info(track_id, need_formats=True)
             
             if not video_info:
                 return None
@@ -606,32 +810,30 @@ class ModuleInterface:
             
             # Look for low-quality audio-only formats (prefer worstaudio for speed)
             # Format priority: audio-only with opus > aac > mp3 > any audio-only
-            preferred_codecs = ['opus', 'aac', 'mp3']
-            selected_format = None
+            preferred_codecs = ('opus', 'aac', 'mp3')
             
-            # First pass: try to find audio-only formats with preferred codecs
-            for codec in preferred_codecs:
-                for fmt in formats:
-                    # Check if format is audio-only (no video codec) and matches codec
-                    if fmt.get('vcodec') == 'none' and fmt.get('acodec') != 'none' and \
-                       fmt.get('acodec', '').startswith(codec):
-                        # Prefer lower bitrate for faster loading - sort by bitrate
-                        if selected_format is None:
-                            selected_format = fmt
-                        else:
-                            # Compare bitrates and prefer lower
-                            current_abr = selected_format.get('abr', 0) or selected_format.get('tbr', 0) or 0
-                            fmt_abr = fmt.get('abr', 0) or fmt.get('tbr', 0) or 0
-                            if fmt_abr < current_abr:
-                                selected_format = fmt
+            # Single pass: remember the lowest-bitrate audio-only format per preferred codec,
+            # plus the lowest-bitrate audio-only format of any codec as a fallback
+            best = {}  # codec -> (abr, fmt)
+            fallback = None
+            for fmt in formats:
+                acodec = fmt.get('acodec') or ''
+                # Check if format is audio-only (no video codec)
+                if fmt.get('vcodec') != 'none' or acodec == 'none':
+                    continue
+                # Prefer lower bitrate for faster loading
+                abr = fmt.get('abr') or fmt.get('tbr') or 0
+                if fallback is None or abr < fallback[0]:
+                    fallback = (abr, fmt)
+                for codec in preferred_codecs:
+                    if acodec.startswith(codec):
+                        current = best.get(codec)
+                        if current is None or abr < current[0]:
+                            best[codec] = (abr, fmt)
+                        break
             
-            # If no preferred codec found, get any audio-only format (lowest bitrate)
-            if not selected_format:
-                audio_formats = [f for f in formats if f.get('vcodec') == 'none' and f.get('acodec') != 'none']
-                if audio_formats:
-                    # Sort by bitrate (ascending) to get lowest quality for faster loading
-                    audio_formats.sort(key=lambda x: x.get('abr', 0) or x.get('tbr', 0) or 0)
-                    selected_format = audio_formats[0]
+            choice = next((best[c] for c in preferred_codecs if c in best), fallback)
+            selected_format = choice[1] if choice else None
             
             if selected_format:
                 # Get the URL from the format
@@ -0,0 +1,64 @@
+"""
+Persistent metadata cache for the OrpheusDL YouTube module.
+Stores yt-dlp info dicts in SQLite as zlib-compressed JSON, with a default TTL that callers can override per lookup.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional, Any
+
+
+class MetadataCache:
+    """Small SQLite key/value store with expiry. Best effort: storage errors never reach callers."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, fetched_at INTEGER NOT NULL, payload BLOB NOT NULL)'
+        )
+        # Drop expired rows so the file doesn't grow forever
+        self._conn.execute('DELETE FROM cache WHERE fetched_at < ?', (int(time.time() - ttl_seconds),))
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value, or None if missing or older than ttl (defaults to the cache TTL)."""
+        try:
+            with self._lock:
+                row = self._conn.execute('SELECT payload, fetched_at FROM cache WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row or time.time() - row[1] >= (self.ttl_seconds if ttl is None else ttl):
+            return None
+        try:
+            return json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            return None
+
+    def set(self, key: str, value: Any):
+        try:
+            payload = zlib.compress(json.dumps(value, default=str).encode('utf-8'))
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, fetched_at, payload) VALUES (?, ?, ?)',
+                    (key, int(time.time()), payload)
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def clear(self):
+        try:
+            with self._lock:
+                self._conn.execute('DELETE FROM cache')
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
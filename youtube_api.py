@@ -3,20 +3,174 @@ YouTube API wrapper using yt-dlp for OrpheusDL.
 Provides search, metadata extraction, and audio download functionality with JS runtime logging.
 """
 
+import functools
+import hashlib
+import itertools
 import os
+import random
 import re
+import concurrent.futures
 import shutil
-import tempfile
-from pathlib import Path
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
-from contextlib import contextmanager
-from urllib.parse import quote
+from urllib.parse import quote, urlparse, parse_qs
 
 # Lazy import yt-dlp to avoid PyInstaller issues
 yt_dlp = None
+_YoutubeDL = None  # yt_dlp.YoutubeDL, resolved once
 _cookie_warning_shown = False
-_shown_warnings = set()
+_shown_warnings = OrderedDict()  # Warnings already printed, oldest first
+_SHOWN_WARNINGS_MAX = 1024
+_log_lock = threading.Lock()  # yt-dlp calls run in worker threads (batch info, channel avatars)
 _js_runtime_logged = False  # Runtime log guard
+_aria2c_logged = False  # External downloader log guard
+_ffmpeg_warning_shown = False  # Missing ffmpeg is reported once per process
+
+# Bulky or short-lived info dict keys left out of the on-disk cache (stream URLs expire after hours)
+_NOT_PERSISTED_KEYS = frozenset(('formats', 'requested_formats', 'requested_downloads', 'automatic_captions', 'subtitles', 'heatmap'))
+# In-memory search results cache: users often refine a query and then go back to the previous one
+_SEARCH_CACHE_TTL = 15 * 60
+_SEARCH_CACHE_SIZE = 256
+_CHANNEL_THUMB_CACHE_SIZE = 512
+_WORKER_THREADS = 8  # Threads per YouTubeAPI pool (batch info and channel avatars, downloads, *_async)
+# How often to look for deno again while it is missing (user may install it mid-session)
+_DENO_RECHECK_SECONDS = 60
+
+# download_audio format selectors: preferred codec first, then the other audio codecs
+_FORMAT_MAP = {
+    'opus': 'bestaudio[acodec=opus]/bestaudio[acodec=aac]/bestaudio[acodec=mp3]/bestaudio/best',
+    'mp3': 'bestaudio[acodec=mp3]/bestaudio[acodec=opus]/bestaudio[acodec=aac]/bestaudio/best',
+    'm4a': 'bestaudio[acodec=aac]/bestaudio[acodec=opus]/bestaudio[acodec=mp3]/bestaudio/best',
+}
+_EXTRACT_AUDIO_PP = {'key': 'FFmpegExtractAudio', 'preferredquality': '192'}
+_EXTRACT_CODECS = frozenset(('mp3', 'opus', 'm4a', 'aac'))
+# Fallback lookup order for the downloaded file when no postprocessor reported it
+_OUTPUT_EXTS = ('opus', 'mp3', 'm4a', 'webm', 'ogg')
+# Extensions a finished download of each codec ends up with
+_CODEC_EXTS = {'opus': ('opus',), 'mp3': ('mp3',), 'm4a': ('m4a', 'aac'), 'aac': ('m4a', 'aac')}
+# yt-dlp's in-progress and sidecar files, never a finished download
+_PARTIAL_EXTS = frozenset(('part', 'ytdl', 'temp', 'json', 'jpg', 'webp', 'png', 'vtt'))
+
+# extractor_args for metadata-only calls: no player configs/JS, no streaming manifests or translated subs
+_METADATA_EXTRACTOR_ARGS = {'youtube': {'player_skip': ['configs', 'webpage', 'js'], 'skip': ['hls', 'dash', 'translated_subs']}}
+
+# Compiled once at import; parse_youtube_url may run for every line of a pasted link list
+# Fast path for canonical video, playlist and channel links: one anchored regex with named
+# alternatives. Anything it doesn't match (other hosts, odd query order) goes through urlparse.
+_URL_RE = re.compile(r'''
+    (?:https?://)?(?:(?:www|m|music)\.)?
+    (?:
+        (?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/|shorts/|live/))(?P<video>[a-zA-Z0-9_-]{11})
+      | youtube\.com/playlist\?list=(?P<playlist>[a-zA-Z0-9_-]+)(?=$|[&#])
+      # A list= parameter makes any other link a playlist link
+      | youtube\.com/(?![^#]*[?&]list=)
+        (?:channel/(?P<channel>[a-zA-Z0-9_-]+)|(?P<handle>(?:c/|@)[a-zA-Z0-9_.-]+))
+    )
+''', re.VERBOSE)
+# First YouTube link anywhere in a string, up to whitespace, quotes or angle brackets
+_EMBEDDED_URL_RE = re.compile(r'(?:https?://|//)?(?:[a-zA-Z0-9-]+\.)*(?:youtube\.com|youtu\.be)/[^\s<>"\'`]*')
+_VIDEO_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
+_LIST_ID_RE = re.compile(r'[a-zA-Z0-9_-]+')
+_HANDLE_RE = re.compile(r'[a-zA-Z0-9_\.-]+')
+# yt-dlp warnings never shown to the user
+_SKIP_WARNING_RE = re.compile(r'No supported JavaScript runtime|web client https formats have been skipped')
+_LOG_CLEAN_RE = re.compile(r'^\[.*?\]\s+.*?:?\s+(.*)$')
+
+
+def _remove_temp_cookie_file(path: str):
+    try: os.remove(path)
+    except FileNotFoundError: pass
+    except Exception as e:
+        print(f"[YouTube] Warning: Could not remove temp cookie file {path}: {e}")
+
+
+def _release_ydl(ydl):
+    """Close a YoutubeDL's HTTP session without writing its cookie jar back to disk
+    (YoutubeDL.close() only saves cookies when a cookiefile is set)."""
+    ydl.params['cookiefile'] = None
+    try: ydl.close()
+    except Exception: pass
+
+
+def _release_ydls(ydls: Dict[Any, Any]):
+    for ydl in list(ydls.values()):
+        _release_ydl(ydl)
+    ydls.clear()
+
+
+class YtDlpLogger:
+    """Routes yt-dlp output through the module's console messages, showing each warning once."""
+    # Runtime detection only matters until the first hit; check the flag before the call
+    def debug(self, msg):
+        if not _js_runtime_logged: self._detect_runtime(msg)
+    def info(self, msg):
+        if not _js_runtime_logged: self._detect_runtime(msg)
+    def warning(self, msg):
+        global _cookie_warning_shown
+        if not _js_runtime_logged: self._detect_runtime(msg)
+        if _SKIP_WARNING_RE.search(msg): return
+        if "The provided YouTube account cookies are no longer valid" in msg:
+            if _cookie_warning_shown: return
+            _cookie_warning_shown = True
+        clean_msg = _LOG_CLEAN_RE.match(msg)
+        clean_msg = clean_msg.group(1) if clean_msg else msg
+        with _log_lock:
+            if clean_msg in _shown_warnings:
+                # Keep recurring warnings from being evicted and shown again
+                _shown_warnings.move_to_end(clean_msg)
+                return
+            _shown_warnings[clean_msg] = None
+            if len(_shown_warnings) > _SHOWN_WARNINGS_MAX:
+                _shown_warnings.popitem(last=False)
+        print(f"[YouTube Warning] {msg}")
+    def error(self, msg):
+        print(f"[YouTube Error] {msg}")
+    def _detect_runtime(self, msg):
+        global _js_runtime_logged
+        msg_l = msg.lower()
+        if "no supported javascript runtime" in msg_l:
+            print("[YouTube] No JavaScript runtime (e.g. Deno) found. Some formats may be limited. Install from https://deno.land or see Settings.")
+            _js_runtime_logged = True
+        elif "using js runtime" in msg_l:
+            print(f"[YouTube] JS runtime detected: {msg}")
+            _js_runtime_logged = True
+        elif ("deno" in msg_l and "js" in msg_l) or ("node" in msg_l and "js" in msg_l):
+            if "could not be found" not in msg_l and "no supported" not in msg_l:
+                print(f"[YouTube] JS runtime detected: {msg}")
+                _js_runtime_logged = True
+
+
+_YTDLP_LOGGER = YtDlpLogger()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which, looked up once per process. Not used for deno, which is re-checked while missing."""
+    return shutil.which(cmd)
+
+
+class _YdlPool:
+    """One thread's pooled YoutubeDLs by options signature, released when that thread's locals
+    go away (the thread exits); YouTubeAPI.close() empties it first."""
+
+    def __init__(self):
+        self.ydls = {}
+        weakref.finalize(self, _release_ydls, self.ydls)
+
+
+class _CookieCopy:
+    """Temp copy of the cookies file owned by one thread, deleted when that thread's
+    locals are released (or at interpreter exit)."""
+
+    def __init__(self):
+        import tempfile
+        fd, self.path = tempfile.mkstemp(suffix='.txt', prefix='yt_cookies_')
+        os.close(fd)
+        self.mtime = None
+        weakref.finalize(self, _remove_temp_cookie_file, self.path)
 
 
 def _get_yt_dlp():
@@ -65,6 +219,68 @@ def _get_yt_dlp():
     return yt_dlp
 
 
+def _get_youtube_dl():
+    """The YoutubeDL class, imported on first use and then kept in a module global."""
+    global _YoutubeDL
+    if _YoutubeDL is None:
+        _YoutubeDL = _get_yt_dlp().YoutubeDL
+    return _YoutubeDL
+
+
+def _entry_to_result(entry: Dict[str, Any], search_type: str, thumb: Optional[str]) -> Dict[str, Any]:
+    """Build a video/playlist search result dict from a flat search entry."""
+    get = entry.get
+    entry_id = get('id')
+    uploader = get('uploader') or get('channel') or 'Unknown'
+    is_playlist = search_type == 'playlist'
+    out = {
+        'id': entry_id,
+        'title': get('title'),
+        'uploader': uploader,
+        'channel': get('channel') or uploader,
+        'channel_id': get('channel_id'),
+        'duration': get('duration'),
+        'upload_date': get('upload_date'),
+        'url': get('url') or (f"https://www.youtube.com/playlist?list={entry_id}" if is_playlist else f"https://www.youtube.com/watch?v={entry_id}"),
+        'thumbnail': thumb,
+        'type': 'playlist' if is_playlist else 'video',
+    }
+    if is_playlist:
+        out['playlist_count'] = get('playlist_count') or get('n_entries')
+    return out
+
+
+def _channel_to_result(entry: Dict[str, Any], thumb: Optional[str]) -> Dict[str, Any]:
+    """Build a channel search result dict from a flat search entry."""
+    cid = entry['channel_id']
+    return {
+        'id': cid,
+        'title': entry.get('channel') or entry.get('uploader') or 'Unknown',
+        'url': f"https://www.youtube.com/channel/{cid}",
+        'type': 'channel',
+        'thumbnail': thumb
+    }
+
+
+def _find_output_file(output_path: str, preferred_codec: Optional[str] = None) -> Optional[str]:
+    """Return output_path.<ext> for the first extension of preferred_codec, then of _OUTPUT_EXTS,
+    that exists, else any other finished output_path.<ext>, using one directory scan."""
+    dirp, base = os.path.split(output_path)
+    found = {}
+    try:
+        with os.scandir(dirp or '.') as it:
+            for e in it:
+                stem, dot, ext = e.name.rpartition('.')
+                if dot and stem == base and ext not in _PARTIAL_EXTS and e.is_file():
+                    found[ext] = os.path.join(dirp, e.name)
+    except OSError:
+        return None
+    for ext in _CODEC_EXTS.get(preferred_codec, ()) + _OUTPUT_EXTS:
+        if ext in found:
+            return found[ext]
+    return next(iter(found.values()), None)
+
+
 class YouTubeAPI:
     """Wrapper around yt-dlp for YouTube operations with runtime logging."""
 
@@ -75,17 +291,105 @@ class YouTubeAPI:
             self.sleep_interval = int(kwargs.get('sleep_interval', 5))
         except (ValueError, TypeError):
             self.sleep_interval = 5
+        # Per-kind TTLs (seconds) for the on-disk metadata cache; 0 disables caching that kind
+        self.cache_ttl_video = kwargs.get('cache_ttl_video', 24 * 3600)
+        self.cache_ttl_playlist = kwargs.get('cache_ttl_playlist', 6 * 3600)
+        self.cache_ttl_channel = kwargs.get('cache_ttl_channel', 24 * 3600)
+        self.cache_ttl_search = kwargs.get('cache_ttl_search', 3600)
+        self._cache = None
+        # Entries are namespaced by the cookies file's contents, so metadata seen by one account
+        # (age-restricted, members-only) is never served to another; (stat key, namespace)
+        self._cache_ns = (None, 'anon')
+        cache_path = kwargs.get('cache_path')
+        if cache_path:
+            try:
+                from .metadata_cache import MetadataCache  # sqlite3 is only loaded when the cache is on
+                max_ttl = max(self.cache_ttl_video, self.cache_ttl_playlist, self.cache_ttl_channel, self.cache_ttl_search)
+                self._cache = MetadataCache(cache_path, max_ttl)
+            except Exception as e:
+                print(f"[YouTube] Warning: Metadata cache disabled: {e}")
+        # Resolve missing channel avatars in channel search concurrently; turn off on rate-limited networks
+        self.parallel_thumbnails = bool(kwargs.get('parallel_thumbnails', True))
+        # Download through aria2c when installed; opt-in, since it opens 16 connections per file
+        self.use_aria2c = bool(kwargs.get('use_aria2c', False))
+        self._base_opts = None
+        self._deno_available = False
+        self._deno_checked_at = 0.0
+        # Temp cookies copy per thread: yt-dlp rewrites the file when a YoutubeDL closes
+        self._cookie_local = threading.local()
+        # Extraction YoutubeDL instances kept open between calls, per thread and per options
+        self._ydl_local = threading.local()
+        self._ydl_pools = weakref.WeakSet()
+        self._ydl_lock = threading.Lock()
+        self._search_cache: OrderedDict = OrderedDict()
+        # Channel avatars by channel ID; the same channels come back across searches
+        self._channel_thumb_cache: OrderedDict = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._temp_dir = None
+        # Worker threads for the *_async methods, started on first use
+        self._executor = None
+        # Worker threads for batch fetches, kept for the API's lifetime so their pooled
+        # YoutubeDLs and cookies copies are reused across batches
+        self._workers = None
+        # Separate threads for download_audio_many: downloads run for minutes and mustn't hold
+        # the threads metadata fetches use
+        self._download_workers = None
+        # Calls handed to either pool and not yet returned; close() waits for them
+        self._tasks_pending = 0
+        self._tasks_done = threading.Condition(self._ydl_lock)
+        self._task_local = threading.local()
+        self._temp_seq = itertools.count()
         self._check_ffmpeg_availability()
 
+    def _cache_get(self, key: str, ttl: float) -> Optional[Any]:
+        if not self._cache or ttl <= 0:
+            return None
+        return self._cache.get(f'{self._cache_namespace()}:{key}', ttl)
+
+    def _cache_set(self, key: str, value: Any, ttl: float):
+        if self._cache and ttl > 0 and value:
+            self._cache.set(f'{self._cache_namespace()}:{key}', value)
+
+    def _cache_namespace(self) -> str:
+        """'anon' without a cookies file, else a hash of its contents, so replacing the file with
+        another account's cookies switches namespaces. Only re-hashed when the file changes."""
+        if not self.cookies_path:
+            return 'anon'
+        try:
+            st = os.stat(self.cookies_path)
+        except OSError:
+            return 'anon'
+        stat_key, ns = self._cache_ns
+        if stat_key != (st.st_mtime_ns, st.st_size):
+            try:
+                with open(self.cookies_path, 'rb') as f:
+                    ns = hashlib.sha1(f.read()).hexdigest()[:12]
+            except OSError:
+                return 'anon'
+            self._cache_ns = ((st.st_mtime_ns, st.st_size), ns)
+        return ns
+
+    def clear_cache(self):
+        """Drop cached search results and channel avatars, and everything in the on-disk metadata cache."""
+        with self._memo_lock:
+            self._search_cache.clear()
+            self._channel_thumb_cache.clear()
+        if self._cache:
+            self._cache.clear()
+
     def _check_ffmpeg_availability(self):
+        global _ffmpeg_warning_shown
+        if _ffmpeg_warning_shown:
+            return
         import platform
-        if platform.system() == 'Windows':
+        system = platform.system()
+        if system == 'Windows':
             return
         if self.ffmpeg_path and os.path.isfile(self.ffmpeg_path):
             return
-        if shutil.which('ffmpeg'):
+        if _which('ffmpeg'):
             return
-        system = platform.system()
+        _ffmpeg_warning_shown = True
         if system == 'Darwin':
             print("[YouTube] WARNING: ffmpeg not found. Install with: brew install ffmpeg")
         elif system == 'Linux':
@@ -94,87 +398,214 @@ class YouTubeAPI:
             print("[YouTube] WARNING: ffmpeg not found. Please install ffmpeg for audio extraction.")
 
     def _get_base_opts(self) -> Dict[str, Any]:
-        """Get base yt-dlp options with JS runtime detection (PyInstaller safe)."""
-        global _js_runtime_logged, _cookie_warning_shown, _shown_warnings
-
-        class YtDlpLogger:
-            def debug(self, msg): self._detect_runtime(msg)
-            def info(self, msg): self._detect_runtime(msg)
-            def warning(self, msg):
-                self._detect_runtime(msg)
-                if "No supported JavaScript runtime" in msg: return
-                if "web client https formats have been skipped" in msg: return
-                if "The provided YouTube account cookies are no longer valid" in msg:
-                    if _cookie_warning_shown: return
-                    _cookie_warning_shown = True
-                clean_msg = re.match(r'^\[.*?\]\s+.*?:?\s+(.*)$', msg)
-                clean_msg = clean_msg.group(1) if clean_msg else msg
-                if clean_msg in _shown_warnings: return
-                _shown_warnings.add(clean_msg)
-                print(f"[YouTube Warning] {msg}")
-            def error(self, msg):
-                print(f"[YouTube Error] {msg}")
-            def _detect_runtime(self, msg):
-                global _js_runtime_logged
-                if _js_runtime_logged:
-                    return
-                msg_l = msg.lower()
-                if "no supported javascript runtime" in msg_l:
-                    print("[YouTube] No JavaScript runtime (e.g. Deno) found. Some formats may be limited. Install from https://deno.land or see Settings.")
-                    _js_runtime_logged = True
-                elif "using js runtime" in msg_l:
-                    print(f"[YouTube] JS runtime detected: {msg}")
-                    _js_runtime_logged = True
-                elif ("deno" in msg_l and "js" in msg_l) or ("node" in msg_l and "js" in msg_l):
-                    if "could not be found" not in msg_l and "no supported" not in msg_l:
-                        print(f"[YouTube] JS runtime detected: {msg}")
-                        _js_runtime_logged = True
-
-        opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'ignoreerrors': False,
-            'logger': YtDlpLogger(),
-            'sleep_interval': self.sleep_interval,
-            # Enable EJS challenge solver script downloads from GitHub. Required when yt-dlp
-            # is used as a library (PyInstaller/frozen) since EJS scripts are not bundled.
-            # See https://github.com/yt-dlp/yt-dlp/wiki/EJS
-            'remote_components': ['ejs:github'],
-            'cachedir': False,
-        }
-        if self.ffmpeg_path:
-            opts['ffmpeg_location'] = self.ffmpeg_path
-        # JS runtime attempt: deno first (no console message here; YtDlpLogger will warn if yt-dlp hits runtime limits)
-        try:
-            if shutil.which("deno"):
+        """Get base yt-dlp options with JS runtime detection (PyInstaller safe).
+        Built once and copied per call; deno is looked up again every minute while it is missing."""
+        global _js_runtime_logged
+        now = time.monotonic()
+        if self._base_opts is None or (not self._deno_available and now - self._deno_checked_at >= _DENO_RECHECK_SECONDS):
+            self._deno_checked_at = now
+            opts = {
+                'quiet': True,
+                'no_warnings': True,
+                'ignoreerrors': False,
+                'logger': _YTDLP_LOGGER,
+                'sleep_interval': self.sleep_interval,
+                # Enable EJS challenge solver script downloads from GitHub. Required when yt-dlp
+                # is used as a library (PyInstaller/frozen) since EJS scripts are not bundled.
+                # See https://github.com/yt-dlp/yt-dlp/wiki/EJS
+                'remote_components': ['ejs:github'],
+                'cachedir': False,
+            }
+            if self.ffmpeg_path:
+                opts['ffmpeg_location'] = self.ffmpeg_path
+            # JS runtime attempt: deno first (no console message here; YtDlpLogger will warn if yt-dlp hits runtime limits)
+            self._deno_available = bool(shutil.which("deno"))
+            if self._deno_available:
                 opts['js_runtime'] = 'deno'
-            else:
-                raise FileNotFoundError("deno not found in PATH")
-        except Exception:
-            opts.pop('js_runtime', None)
-            if not _js_runtime_logged:
+            elif not _js_runtime_logged:
                 _js_runtime_logged = True
                 # Do not print here: this runs on first YouTube use (e.g. "Search all platforms"), which would show
                 # a YouTube message even when the user is only searching Qobuz/others. The GUI shows a Deno
                 # install dialog when the user actually tries a YouTube download (macOS/Linux).
-        return opts
+            self._base_opts = opts
+        return dict(self._base_opts)
 
-    @contextmanager
-    def _managed_options(self) -> Dict[str, Any]:
+    def _cookie_file(self) -> Optional[str]:
+        """This thread's temp copy of the cookies file, refreshed only when the source file changes."""
+        if not self.cookies_path:
+            return None
+        try:
+            mtime = os.path.getmtime(self.cookies_path)
+        except OSError:
+            return None
+        try:
+            copy = getattr(self._cookie_local, 'copy', None)
+            if copy is None:
+                copy = self._cookie_local.copy = _CookieCopy()
+            if mtime != copy.mtime:
+                # copyfile, not copy2: contents only (in-kernel where the OS allows), and the
+                # copy keeps mkstemp's owner-only permissions instead of mirroring the source's
+                shutil.copyfile(self.cookies_path, copy.path)
+                copy.mtime = mtime
+        except OSError as e:
+            print(f"[YouTube] Warning: Could not copy cookies file: {e}")
+            return None
+        return copy.path
+
+    def _ydl_options(self, metadata_only: bool = False) -> Dict[str, Any]:
+        """yt-dlp options with cookies. metadata_only is for calls that never resolve playable
+        formats (search, playlist, channel): player JS and manifests are skipped."""
         opts = self._get_base_opts()
-        temp_cookie_path = None
+        if metadata_only:
+            opts.pop('remote_components', None)
+            opts['extractor_args'] = _METADATA_EXTRACTOR_ARGS
+        cookie_file = self._cookie_file()
+        if cookie_file:
+            opts['cookiefile'] = cookie_file
+        return opts
+
+    def _get_pooled_ydl(self, opts: Dict[str, Any]) -> Any:
+        """
+        Long-lived YoutubeDL for extraction calls, so extractor setup, cookie loading and the
+        HTTP session are reused. Instances are per thread (YoutubeDL is not thread-safe) and
+        per options signature; the cookies mtime is part of it so a refreshed file is picked up.
+        A thread's instances are released when it exits (see _YdlPool).
+        """
+        YoutubeDL = _get_youtube_dl()
+        pool = getattr(self._ydl_local, 'pool', None)
+        if pool is None:
+            pool = self._ydl_local.pool = _YdlPool()
+            with self._ydl_lock:
+                self._ydl_pools.add(pool)
+        cookie_copy = getattr(self._cookie_local, 'copy', None)
+        sig = (cookie_copy and cookie_copy.mtime, repr(sorted(opts.items())))
+        ydl = pool.ydls.get(sig)
+        if ydl is None:
+            ydl = YoutubeDL(opts)
+            # Instances opened before the cookies file changed are retired without saving
+            # their old cookie jar over the copy that was just refreshed
+            with self._ydl_lock:
+                stale = [pool.ydls.pop(k) for k in [k for k in pool.ydls if k[0] != sig[0]]]
+                pool.ydls[sig] = ydl
+            for old in stale:
+                _release_ydl(old)
+        return ydl
+
+    def close(self):
+        """Close pooled YoutubeDL instances (saves their cookies) and start with a fresh pool.
+        Also stops the worker threads behind the batch and *_async methods, after letting the
+        work already handed to them finish: their YoutubeDLs are among those being closed."""
+        if getattr(self._task_local, 'active', False):
+            raise RuntimeError("YouTubeAPI.close() can't run on one of its own worker threads")
+        with self._tasks_done:
+            executor, self._executor = self._executor, None
+            workers, self._workers = self._workers, None
+            download_workers, self._download_workers = self._download_workers, None
+            while self._tasks_pending:
+                self._tasks_done.wait()
+            # Emptied here so the pools' own finalizers don't release these without saving cookies
+            open_ydls = []
+            for pool in self._ydl_pools:
+                open_ydls.extend(pool.ydls.values())
+                pool.ydls.clear()
+            self._ydl_pools = weakref.WeakSet()
+            self._ydl_local = threading.local()
+        for ydl in open_ydls:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        for pool in (executor, workers, download_workers):
+            if pool:
+                pool.shutdown(wait=True)
+
+    def _tracked(self, fn, count: int):
+        """Wrap fn for the worker threads; call with _ydl_lock held while submitting count calls.
+        close() waits until every one of them has returned."""
+        self._tasks_pending += count
+
+        def run(*args):
+            self._task_local.active = True
+            try:
+                return fn(*args)
+            finally:
+                self._task_local.active = False
+                self._task_finished()
+        return run
+
+    def _task_finished(self):
+        with self._tasks_done:
+            self._tasks_pending -= 1
+            self._tasks_done.notify_all()
+
+    def _fan_out(self, fn, items: List[Any], max_workers: int, downloads: bool = False) -> List[Any]:
+        """fn over items on the API's long-lived worker threads (the download threads if
+        downloads is set), at most max_workers at a time. Only that many are submitted; the next
+        item goes in as one finishes, so the other threads stay free for other callers.
+        Results are in the order of items. fn must not fan out itself: it would wait on its own pool."""
+        if len(items) <= 1 or max_workers <= 1:
+            return [fn(item) for item in items]
+        attr, prefix = ('_download_workers', 'youtube-download') if downloads else ('_workers', 'youtube-worker')
+        with self._ydl_lock:
+            pool = getattr(self, attr)
+            if pool is None:
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers=_WORKER_THREADS, thread_name_prefix=prefix)
+                setattr(self, attr, pool)
+            # The batch itself counts as pending, so close() can't shut the pool down between submissions
+            self._tasks_pending += 1
+        results = [None] * len(items)
+        todo = iter(enumerate(items))
+        running = {}
         try:
-            if self.cookies_path and os.path.isfile(self.cookies_path):
-                fd, temp_cookie_path = tempfile.mkstemp(suffix='.txt', prefix='yt_cookies_')
-                os.close(fd)
-                shutil.copy2(self.cookies_path, temp_cookie_path)
-                opts['cookiefile'] = temp_cookie_path
-            yield opts
+            for i, item in itertools.islice(todo, max_workers):
+                running[self._submit(pool, fn, item)] = i
+            while running:
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                    for i, item in itertools.islice(todo, 1):
+                        running[self._submit(pool, fn, item)] = i
         finally:
-            if temp_cookie_path and os.path.exists(temp_cookie_path):
-                try: os.remove(temp_cookie_path)
-                except Exception as e:
-                    print(f"[YouTube] Warning: Could not remove temp cookie file {temp_cookie_path}: {e}")
+            self._task_finished()
+        return results
+
+    def _submit(self, pool: concurrent.futures.Executor, fn, item: Any) -> concurrent.futures.Future:
+        with self._ydl_lock:
+            return pool.submit(self._tracked(fn, 1), item)
+
+    async def _run_async(self, fn, *args, **kwargs):
+        """Run a blocking method on the shared worker threads, so event-loop callers aren't blocked
+        by yt-dlp. Each worker keeps its own pooled YoutubeDL, like the batch methods."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        with self._ydl_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=_WORKER_THREADS, thread_name_prefix='youtube')
+            future = loop.run_in_executor(self._executor, self._tracked(functools.partial(fn, *args, **kwargs), 1))
+        return await future
+
+    async def search_async(self, query: str, search_type: str = 'video', limit: int = 10) -> List[Dict[str, Any]]:
+        return await self._run_async(self.search, query, search_type, limit)
+
+    async def get_video_info_async(self, video_id: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
+        return await self._run_async(self.get_video_info, video_id, use_cache)
+
+    async def get_playlist_info_async(self, playlist_id: str, deep: bool = False) -> Optional[Dict[str, Any]]:
+        return await self._run_async(self.get_playlist_info, playlist_id, deep)
+
+    async def get_channel_info_async(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        return await self._run_async(self.get_channel_info, channel_id)
+
+    async def aclose(self):
+        import asyncio
+        # close() waits for in-flight work; do that off the event loop
+        await asyncio.to_thread(self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
 
     def _thumbnail_from_entry(self, entry: Dict[str, Any], entry_id: Optional[str], search_type: str) -> Optional[str]:
         """Resolve thumbnail URL from a search result entry (video, playlist, or channel)."""
@@ -183,34 +614,56 @@ class YouTubeAPI:
             thumb = entry.get('channel_thumbnail')
             if not thumb and entry.get('thumbnails'):
                 # Prefer avatar-shaped thumbnails (small square); video thumbs are typically 120x90 etc.
-                thumbs = entry['thumbnails']
-                if thumbs:
-                    # Channel avatars are usually small and square (e.g. 48x48, 88x88, 176x176)
-                    square = [t for t in thumbs if t.get('width') and t.get('height') and abs((t.get('width') or 0) - (t.get('height') or 0)) <= 16]
-                    if square:
-                        best = max(square, key=lambda t: (t.get('width') or 0) * (t.get('height') or 0))
-                        thumb = best.get('url')
+                # Channel avatars are usually small and square (e.g. 48x48, 88x88, 176x176)
+                best_area = -1
+                for t in entry['thumbnails']:
+                    w, h = t.get('width'), t.get('height')
+                    if w and h and abs(w - h) <= 16 and w * h > best_area:
+                        best_area, thumb = w * h, t.get('url')
             if not thumb and entry_id:
                 return self.get_channel_thumbnail(entry_id)
             return thumb or None
         thumb = entry.get('thumbnail')
         if not thumb and entry.get('thumbnails'):
-            thumbs = entry['thumbnails']
-            if thumbs:
-                best = max(thumbs, key=lambda t: (t.get('width') or 0) * (t.get('height') or 0))
-                thumb = best.get('url') or thumb
+            best_area, best_url = -1, None
+            for t in entry['thumbnails']:
+                area = (t.get('width') or 0) * (t.get('height') or 0)
+                if area > best_area:
+                    best_area, best_url = area, t.get('url')
+            thumb = best_url or thumb
         if not thumb and entry.get('channel_thumbnail'):
             thumb = entry['channel_thumbnail']
         if not thumb and search_type == 'video' and entry_id:
             return f"https://i.ytimg.com/vi/{entry_id}/hqdefault.jpg"
         if not thumb and search_type == 'playlist' and entry_id:
-            playlist_info = self.get_playlist_info(entry_id)
-            if playlist_info and playlist_info.get('thumbnail'):
-                return playlist_info['thumbnail']
+            playlist_thumb = self.get_playlist_thumbnail(entry_id)
+            if playlist_thumb:
+                return playlist_thumb
         return thumb or None
 
     def search(self, query: str, search_type: str = 'video', limit: int = 10) -> List[Dict[str, Any]]:
-        _yt_dlp = _get_yt_dlp()
+        key = (query, search_type, limit)
+        with self._memo_lock:
+            ts, results = self._search_cache.get(key, (0, None))
+            if results is not None and time.monotonic() - ts < _SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                return list(results)
+        cache_key = f'search:{search_type}:{limit}:{query}'
+        results = self._cache_get(cache_key, self.cache_ttl_search)
+        if not results:
+            results = self._search(query, search_type, limit)
+            self._cache_set(cache_key, results, self.cache_ttl_search)
+        # Empty results are usually a failed request; don't keep those around
+        if results:
+            with self._memo_lock:
+                self._search_cache[key] = (time.monotonic(), results)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return list(results)
+
+    def _search(self, query: str, search_type: str, limit: int) -> List[Dict[str, Any]]:
+        _get_youtube_dl()  # Raise ImportError here, outside the error handling below
         if search_type == 'playlist':
             search_url = f"https://www.youtube.com/results?search_query={quote(query)}&sp=EgIQAw%253D%253D"
         elif search_type == 'channel':
@@ -219,202 +672,339 @@ class YouTubeAPI:
             search_url = f"ytsearch{limit}:{query}"
         results = []
         try:
-            with self._managed_options() as opts:
-                opts['extract_flat'] = True
-                opts['playlist_items'] = f'1-{limit}'
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(search_url, download=False)
-                    if info and 'entries' in info:
-                        entries = info['entries'] or []
-                        if search_type == 'channel':
-                            seen_channels = set()
-                            for entry in entries:
-                                if entry and entry.get('channel_id'):
-                                    cid = entry['channel_id']
-                                    if cid not in seen_channels:
-                                        seen_channels.add(cid)
-                                        thumb = self._thumbnail_from_entry(entry, cid, 'channel')
-                                        results.append({
-                                            'id': cid,
-                                            'title': entry.get('channel', entry.get('uploader', 'Unknown')),
-                                            'url': f"https://www.youtube.com/channel/{cid}",
-                                            'type': 'channel',
-                                            'thumbnail': thumb
-                                        })
-                                        if len(results) >= limit: break
-                        else:
-                            for entry in entries:
-                                if entry:
-                                    vid_id = entry.get('id')
-                                    thumb = self._thumbnail_from_entry(entry, vid_id, search_type)
-                                    out = {
-                                        'id': vid_id or entry.get('id'),
-                                        'title': entry.get('title'),
-                                        'uploader': entry.get('uploader', entry.get('channel', 'Unknown')),
-                                        'channel': entry.get('channel', entry.get('uploader', 'Unknown')),
-                                        'channel_id': entry.get('channel_id'),
-                                        'duration': entry.get('duration'),
-                                        'upload_date': entry.get('upload_date'),
-                                        'url': entry.get('url', f"https://www.youtube.com/watch?v={vid_id}" if vid_id else f"https://www.youtube.com/playlist?list={entry.get('id')}"),
-                                        'thumbnail': thumb,
-                                        'type': 'playlist' if search_type == 'playlist' else 'video',
-                                    }
-                                    if search_type == 'playlist':
-                                        out['playlist_count'] = entry.get('playlist_count') or entry.get('n_entries')
-                                    results.append(out)
+            opts = self._ydl_options(metadata_only=True)
+            opts.update({
+                'extract_flat': 'in_playlist',
+                'playlist_items': f'1-{limit}',
+                'skip_download': True,
+                'youtube_include_dash_manifest': False,
+                'youtube_include_hls_manifest': False,
+            })
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(search_url, download=False)
+            if info and 'entries' in info:
+                entries = info['entries'] or []
+                if search_type == 'channel':
+                    # First entry per channel, in result order
+                    channels = {}
+                    for entry in entries:
+                        if entry and entry.get('channel_id'):
+                            channels.setdefault(entry['channel_id'], entry)
+                            if len(channels) >= limit: break
+                    # No entry_id: avatars still missing are fetched below
+                    results = [_channel_to_result(entry, self._thumbnail_from_entry(entry, None, 'channel'))
+                               for entry in channels.values()]
+                else:
+                    results = [_entry_to_result(entry, search_type, self._thumbnail_from_entry(entry, entry.get('id'), search_type))
+                               for entry in entries if entry]
         except Exception as e:
             print(f"[YouTube] Search error: {e}")
+        if search_type == 'channel':
+            self._fill_channel_thumbnails(results)
         return results
 
-    def get_video_info(self, video_id: str) -> Optional[Dict[str, Any]]:
-        _yt_dlp = _get_yt_dlp()
+    def _fill_channel_thumbnails(self, results: List[Dict[str, Any]]):
+        """Fetch avatars for channel results the flat search didn't provide one for."""
+        missing = []
+        for r in results:
+            if not r.get('thumbnail'):
+                missing.append(r)
+            elif self._is_avatar_url(r['thumbnail']):
+                # Avatar already in the flat entry: later get_channel_thumbnail calls needn't fetch it
+                self._remember_channel_thumbnail(r['id'], r['thumbnail'])
+        if not missing:
+            return
+        ids = [r['id'] for r in missing]
+        thumbs = self._fan_out(self.get_channel_thumbnail, ids, _WORKER_THREADS if self.parallel_thumbnails else 1)
+        for result, thumb in zip(missing, thumbs):
+            result['thumbnail'] = thumb
+
+    def get_video_info(self, video_id: str, use_cache: bool = False, metadata_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Full video info. use_cache=True may return an on-disk cached copy instead, which has no
+        formats, subtitles or other _NOT_PERSISTED_KEYS; only use it when stream URLs aren't needed.
+        metadata_only skips the player JS and format resolution (see _ydl_options); the result has no formats."""
+        if use_cache:
+            cached = self._cache_get(f'video:{video_id}', self.cache_ttl_video)
+            if cached:
+                return cached
+        _get_youtube_dl()
         url = f"https://www.youtube.com/watch?v={video_id}"
         try:
-            with self._managed_options() as opts:
-                opts['extract_flat'] = False
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    return ydl.extract_info(url, download=False)
+            opts = self._ydl_options(metadata_only=metadata_only)
+            opts['extract_flat'] = False
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(url, download=False)
         except Exception as e:
             print(f"[YouTube] Error getting video info: {e}")
             return None
+        self._cache_video_info(video_id, info)
+        if info and metadata_only:
+            # Whatever formats came back without the player JS aren't playable
+            info = {k: v for k, v in info.items() if k not in _NOT_PERSISTED_KEYS}
+        return info
+
+    def _cache_video_info(self, video_id: str, info: Optional[Dict[str, Any]]):
+        if info:
+            self._cache_set(f'video:{video_id}', {k: v for k, v in info.items() if k not in _NOT_PERSISTED_KEYS}, self.cache_ttl_video)
+
+    def get_video_info_batch(self, video_ids: List[str], max_workers: int = 4, use_cache: bool = False,
+                             metadata_only: bool = False) -> List[Optional[Dict[str, Any]]]:
+        """get_video_info for several videos with the network round-trips overlapped, on the API's
+        long-lived worker threads (see _fan_out), so their pooled YoutubeDLs and cookies copies
+        carry over between batches. Results are in the order of video_ids.
+        Each network fetch waits a random fraction of sleep_interval first, so the workers'
+        requests are spread out rather than sent back to back."""
+        # Divided by the worker count: the batch as a whole keeps roughly its unpaced speed
+        max_delay = self.sleep_interval / max(max_workers, 1) if len(video_ids) > 1 else 0
+
+        def fetch(video_id):
+            if use_cache:
+                cached = self._cache_get(f'video:{video_id}', self.cache_ttl_video)
+                if cached:
+                    return cached
+            if max_delay > 0:
+                time.sleep(random.uniform(0, max_delay))
+            return self.get_video_info(video_id, metadata_only=metadata_only)
+        return self._fan_out(fetch, video_ids, max_workers)
+
+    def get_playlist_info(self, playlist_id: str, deep: bool = False, max_workers: int = 8) -> Optional[Dict[str, Any]]:
+        """Flat playlist info. deep=True replaces the flat entries with full video info, fetched
+        concurrently; entries whose fetch fails stay flat."""
+        info = self._get_playlist_info(playlist_id)
+        if not info or not deep:
+            return info
+        entries = [e for e in info.get('entries') or [] if e]
+        # Entries without an ID have nothing to resolve; repeated IDs are fetched once
+        ids = list(dict.fromkeys(e['id'] for e in entries if e.get('id')))
+        full = dict(zip(ids, self.get_video_info_batch(ids, max_workers=max_workers)))
+        return {**info, 'entries': [full.get(e.get('id')) or e for e in entries]}
+
+    def get_playlist_info_batch(self, playlist_ids: List[str], max_workers: int = 4) -> List[Optional[Dict[str, Any]]]:
+        """Flat get_playlist_info for several playlists on the worker threads, like
+        get_video_info_batch. Results are in the order of playlist_ids."""
+        return self._fan_out(self.get_playlist_info, playlist_ids, max_workers)
 
-    def get_playlist_info(self, playlist_id: str) -> Optional[Dict[str, Any]]:
-        _yt_dlp = _get_yt_dlp()
+    def _get_playlist_info(self, playlist_id: str) -> Optional[Dict[str, Any]]:
+        cache_key = f'playlist:{playlist_id}'
+        cached = self._cache_get(cache_key, self.cache_ttl_playlist)
+        if cached:
+            return cached
+        _get_youtube_dl()
         url = f"https://www.youtube.com/playlist?list={playlist_id}"
         try:
-            with self._managed_options() as opts:
-                opts['extract_flat'] = True
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    if info and not info.get('thumbnail'):
-                        entries = info.get('entries', [])
-                        if entries and entries[0] and entries[0].get('thumbnail'):
-                            info['thumbnail'] = entries[0].get('thumbnail')
-                    return info
+            opts = self._ydl_options(metadata_only=True)
+            opts['extract_flat'] = True
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(url, download=False)
         except Exception as e:
             print(f"[YouTube] Error getting playlist info: {e}")
             return None
+        self._cache_set(cache_key, info, self.cache_ttl_playlist)
+        return info
+
+    def get_playlist_thumbnail(self, playlist_id: str) -> Optional[str]:
+        """Playlist thumbnail, falling back to the first video's. Only requests the first entry,
+        so yt-dlp doesn't page through the whole playlist."""
+        cache_key = f'playlist_thumbnail:{playlist_id}'
+        thumb = self._cache_get(cache_key, self.cache_ttl_playlist)
+        if thumb:
+            return thumb
+        _get_youtube_dl()
+        url = f"https://www.youtube.com/playlist?list={playlist_id}"
+        try:
+            opts = self._ydl_options(metadata_only=True)
+            opts['extract_flat'] = True
+            opts['playlist_items'] = '1'
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(url, download=False)
+        except Exception as e:
+            print(f"[YouTube] Error getting playlist thumbnail: {e}")
+            return None
+        if not info:
+            return None
+        thumb = info.get('thumbnail')
+        entries = info.get('entries') or []
+        if not thumb and entries and entries[0]:
+            thumb = entries[0].get('thumbnail')
+        self._cache_set(cache_key, thumb, self.cache_ttl_playlist)
+        return thumb or None
 
     def _is_avatar_url(self, url: str) -> bool:
         """True if URL looks like YouTube channel avatar. =s0 is the banner/full-size; avatar uses =s48, =s160, etc."""
         if not url or 'yt3.googleusercontent.com' not in url:
             return False
         # Reject =s0 (banner / full-size). Avatar has explicit size: =s48, =s88, =s100, =s160, =s176, =s200, ...
-        if re.search(r'=s0(?:-|$|\?|/)', url):
-            return False
-        return bool(re.search(r'=s[1-9]\d+', url))
+        sized = False
+        i = url.find('=s')
+        while i >= 0:
+            c = url[i + 2:i + 3]
+            if c == '0':
+                if url[i + 3:i + 4] in ('', '-', '?', '/'):
+                    return False
+            elif c and c in '123456789' and url[i + 3:i + 4].isdecimal():
+                sized = True
+            i = url.find('=s', i + 2)
+        return sized
 
     def _channel_avatar_from_thumbnails(self, thumbnails: List[Dict[str, Any]]) -> Optional[str]:
         """Pick the channel avatar (small square) from thumbnails; avoid the banner (wide/large). Never return =s0."""
         if not thumbnails:
             return None
         # Only consider thumbnails that look like avatar URLs (=s48, =s160, etc.). Never use =s0 (banner).
-        avatar_candidates = [t for t in thumbnails if t.get('url') and self._is_avatar_url(t.get('url'))]
-        if not avatar_candidates:
-            return None
-        # Prefer small square (by dimensions) among avatar candidates
-        square_small = [
-            t for t in avatar_candidates
-            if (t.get('width') or 0) <= 400 and (t.get('height') or 0) <= 400
-            and abs((t.get('width') or 0) - (t.get('height') or 0)) <= 24
-        ]
-        if square_small:
-            best = max(square_small, key=lambda t: (t.get('width') or 0) * (t.get('height') or 0))
-            return best.get('url')
-        return avatar_candidates[0].get('url')
+        # Prefer the largest small square (by dimensions), else the first avatar URL.
+        first_url, best_area, best_url = None, -1, None
+        for t in thumbnails:
+            url = t.get('url')
+            if not url or not self._is_avatar_url(url):
+                continue
+            if first_url is None:
+                first_url = url
+            w, h = t.get('width') or 0, t.get('height') or 0
+            if w <= 400 and h <= 400 and abs(w - h) <= 24 and w * h > best_area:
+                best_area, best_url = w * h, url
+        return best_url if best_area >= 0 else first_url
 
     def get_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
-        _yt_dlp = _get_yt_dlp()
+        cache_key = f'channel:{channel_id}'
+        cached = self._cache_get(cache_key, self.cache_ttl_channel)
+        if cached:
+            return cached
+        _get_youtube_dl()
         if channel_id.startswith('@') or channel_id.startswith('c/'):
             url = f"https://www.youtube.com/{channel_id}/videos"
         else:
             url = f"https://www.youtube.com/channel/{channel_id}/videos"
         try:
-            with self._managed_options() as opts:
-                opts['extract_flat'] = True
-                opts['playlist_items'] = '1-50'
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    if info and not info.get('thumbnail'):
-                        thumb = (
-                            info.get('channel_thumbnail')
-                            or self._channel_avatar_from_thumbnails(info.get('thumbnails') or [])
-                            or (info.get('thumbnails', [{}])[0].get('url') if info.get('thumbnails') else None)
-                        )
-                        if thumb:
-                            info['thumbnail'] = thumb
-                    return info
+            opts = self._ydl_options(metadata_only=True)
+            opts['extract_flat'] = True
+            opts['playlist_items'] = '1-50'
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(url, download=False)
+            if info and not info.get('thumbnail'):
+                thumb = (
+                    info.get('channel_thumbnail')
+                    or self._channel_avatar_from_thumbnails(info.get('thumbnails') or [])
+                    or (info.get('thumbnails', [{}])[0].get('url') if info.get('thumbnails') else None)
+                )
+                if thumb:
+                    info['thumbnail'] = thumb
         except Exception as e:
             print(f"[YouTube] Error getting channel info: {e}")
             return None
+        self._cache_set(cache_key, info, self.cache_ttl_channel)
+        return info
 
     def get_channel_thumbnail(self, channel_id: str) -> Optional[str]:
         """Fetch channel avatar (profile picture) via yt-dlp. Use channel root URL with
         playlist_items 0 so we get channel metadata only; thumbnail is then the avatar, not the banner."""
-        _yt_dlp = _get_yt_dlp()
+        with self._memo_lock:
+            thumb = self._channel_thumb_cache.get(channel_id)
+            if thumb:
+                self._channel_thumb_cache.move_to_end(channel_id)
+                return thumb
+        cache_key = f'channel_thumbnail:{channel_id}'
+        thumb = self._cache_get(cache_key, self.cache_ttl_channel)
+        if not thumb:
+            # A cached get_channel_info result carries the same thumbnails list; only go to the network without one
+            channel_info = self._cache_get(f'channel:{channel_id}', self.cache_ttl_channel)
+            thumb = (channel_info and self._avatar_from_info(channel_info)) or self._fetch_channel_thumbnail(channel_id)
+            self._cache_set(cache_key, thumb, self.cache_ttl_channel)
+        if thumb:
+            self._remember_channel_thumbnail(channel_id, thumb)
+        return thumb
+
+    def _remember_channel_thumbnail(self, channel_id: str, thumb: str):
+        with self._memo_lock:
+            self._channel_thumb_cache[channel_id] = thumb
+            self._channel_thumb_cache.move_to_end(channel_id)
+            if len(self._channel_thumb_cache) > _CHANNEL_THUMB_CACHE_SIZE:
+                self._channel_thumb_cache.popitem(last=False)
+
+    def _fetch_channel_thumbnail(self, channel_id: str) -> Optional[str]:
+        _get_youtube_dl()
         # Channel root URL (no /videos) + playlist_items 0 => avatar as thumbnail (per yt-dlp docs)
         if channel_id.startswith('@') or channel_id.startswith('c/'):
             url = f"https://www.youtube.com/{channel_id}"
         else:
             url = f"https://www.youtube.com/channel/{channel_id}"
         try:
-            with self._managed_options() as opts:
-                opts['extract_flat'] = True
-                opts['playlist_items'] = '0'
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-            if not info:
-                return None
-            # Prefer avatar only. Never use =s0 (banner/full-size). Every return guarded.
-            thumb = self._return_avatar_only(info.get('channel_thumbnail'))
-            if thumb:
-                return thumb
-            thumb = self._channel_avatar_from_thumbnails(info.get('thumbnails') or [])
-            if thumb:
-                return self._return_avatar_only(thumb) or None
-            thumb = self._return_avatar_only(info.get('thumbnail'))
-            if thumb:
-                return thumb
-            for t in info.get('thumbnails') or []:
-                u = self._return_avatar_only(t.get('url') or '')
-                if u:
-                    return u
-            return None
+            opts = self._ydl_options(metadata_only=True)
+            opts['extract_flat'] = True
+            opts['playlist_items'] = '0'
+            ydl = self._get_pooled_ydl(opts)
+            info = ydl.extract_info(url, download=False)
+            return self._avatar_from_info(info) if info else None
         except Exception as e:
             print(f"[YouTube] Error getting channel thumbnail: {e}")
         return None
 
+    def _avatar_from_info(self, info: Dict[str, Any]) -> Optional[str]:
+        # Prefer avatar only. Never use =s0 (banner/full-size). Every return guarded.
+        thumb = self._return_avatar_only(info.get('channel_thumbnail'))
+        if thumb:
+            return thumb
+        thumb = self._channel_avatar_from_thumbnails(info.get('thumbnails') or [])
+        if thumb:
+            return self._return_avatar_only(thumb) or None
+        thumb = self._return_avatar_only(info.get('thumbnail'))
+        if thumb:
+            return thumb
+        for t in info.get('thumbnails') or []:
+            u = self._return_avatar_only(t.get('url') or '')
+            if u:
+                return u
+        return None
+
     def _return_avatar_only(self, url: Optional[str]) -> Optional[str]:
         """Return URL only if it looks like an avatar (=s48, =s160, etc.). Never return =s0 (banner)."""
         return url if (url and self._is_avatar_url(url)) else None
 
-    def download_audio(self, video_id: str, output_path: str, preferred_codec: str = 'opus') -> Optional[str]:
-        _yt_dlp = _get_yt_dlp()
+    def _apply_external_downloader(self, opts: Dict[str, Any]):
+        """Use aria2c for plain HTTP(S) downloads when enabled and installed. YouTube throttles
+        single connections after a short burst; aria2c splits the file over several connections."""
+        global _aria2c_logged
+        if not self.use_aria2c or not _which('aria2c'):
+            return
+        opts['external_downloader'] = {'http': 'aria2c'}
+        opts['external_downloader_args'] = {'aria2c': ['-x', '16', '-s', '16', '-k', '1M']}
+        if not _aria2c_logged:
+            print("[YouTube] Using aria2c for downloads")
+            _aria2c_logged = True
+
+    def download_audio(self, video_id: str, output_path: str, preferred_codec: str = 'opus', add_metadata: bool = False) -> Optional[str]:
+        """Download audio to output_path + extension. add_metadata embeds yt-dlp's own tags; off by
+        default since OrpheusDL tags the file afterwards."""
+        YoutubeDL = _get_youtube_dl()
         url = f"https://www.youtube.com/watch?v={video_id}"
-        fmt = {
-            'opus': 'bestaudio[acodec=opus]/bestaudio[acodec=aac]/bestaudio[acodec=mp3]/bestaudio/best',
-            'mp3': 'bestaudio[acodec=mp3]/bestaudio[acodec=opus]/bestaudio[acodec=aac]/bestaudio/best',
-            'm4a': 'bestaudio[acodec=aac]/bestaudio[acodec=opus]/bestaudio[acodec=mp3]/bestaudio/best'
-        }.get(preferred_codec, 'bestaudio/best')
+        fmt = _FORMAT_MAP.get(preferred_codec, 'bestaudio/best')
+        final = {}
         try:
-            with self._managed_options() as opts:
-                opts.update({
-                    'format': fmt,
-                    'outtmpl': output_path + '.%(ext)s',
-                    'add_metadata': True,
-                    'postprocessors': [{
-                        'key': 'FFmpegExtractAudio',
-                        'preferredcodec': preferred_codec if preferred_codec in ['mp3', 'opus', 'm4a', 'aac'] else 'opus',
-                        'preferredquality': '192',
-                    }],
-                    'keepvideo': False,
-                })
-                with _yt_dlp.YoutubeDL(opts) as ydl:
-                    ydl.download([url])
-                for ext in ['opus', 'mp3', 'm4a', 'webm', 'ogg']:
-                    path = f"{output_path}.{ext}"
-                    if os.path.isfile(path): return path
-                return None
+            opts = self._ydl_options()
+            opts.update({
+                'format': fmt,
+                'outtmpl': output_path + '.%(ext)s',
+                # No sidecar files: OrpheusDL only needs the audio
+                'writeinfojson': False,
+                'writethumbnail': False,
+                'writesubtitles': False,
+                'postprocessors': [{
+                    **_EXTRACT_AUDIO_PP,
+                    'preferredcodec': preferred_codec if preferred_codec in _EXTRACT_CODECS else 'opus',
+                }],
+                'keepvideo': False,
+                # Each finished postprocessor reports the file; the last one (MoveFiles) is the final path
+                'postprocessor_hooks': [
+                    lambda d: final.update(filepath=d['info_dict'].get('filepath')) if d.get('status') == 'finished' else None
+                ],
+            })
+            if add_metadata:
+                opts['add_metadata'] = True
+            self._apply_external_downloader(opts)
+            with YoutubeDL(opts) as ydl:
+                ydl.download([url])
+            if final.get('filepath') and os.path.isfile(final['filepath']):
+                return final['filepath']
+            return _find_output_file(output_path, preferred_codec)
         except Exception as e:
             msg = str(e)
             cookies_location = self.cookies_path if self.cookies_path else "./config/youtube-cookies.txt"
@@ -425,31 +1015,96 @@ class YouTubeAPI:
             print(f"[YouTube] Download error: {e}")
             return None
 
-    def download_audio_to_temp(self, video_id: str, preferred_codec: str = 'opus') -> Optional[str]:
-        temp_dir = tempfile.mkdtemp()
-        output_path = os.path.join(temp_dir, video_id)
-        return self.download_audio(video_id, output_path, preferred_codec=preferred_codec)
+    def download_audio_to_temp(self, video_id: str, preferred_codec: str = 'opus', add_metadata: bool = False) -> Optional[str]:
+        """Download into this API's temp directory. The caller moves the file away; whatever is
+        left (failed downloads) goes with the directory."""
+        # Sequence suffix: the same video downloading twice at once must not share a file
+        output_path = os.path.join(self._download_temp_dir(), f'{video_id}.{next(self._temp_seq)}')
+        return self.download_audio(video_id, output_path, preferred_codec=preferred_codec, add_metadata=add_metadata)
+
+    def _download_temp_dir(self) -> str:
+        """One temp directory per API object, created on first use and removed when it is
+        garbage collected (or at interpreter exit)."""
+        with self._memo_lock:
+            if self._temp_dir is None or not os.path.isdir(self._temp_dir):
+                import tempfile
+                self._temp_dir = tempfile.mkdtemp(prefix='orpheusdl-youtube-')
+                weakref.finalize(self, shutil.rmtree, self._temp_dir, True)
+            return self._temp_dir
+
+    def download_audio_many(self, video_ids: List[str], out_dir: str, preferred_codec: str = 'opus', max_workers: int = 4) -> List[Optional[str]]:
+        """Download several videos concurrently into out_dir (one file per video ID), on the API's
+        long-lived download threads (see _fan_out), apart from the ones metadata fetches use.
+        Each download runs its own YoutubeDL; the cookies copy belongs to the download thread and
+        is reused by its next download. sleep_interval applies per worker.
+        Returns the downloaded paths in the order of video_ids, None for failed downloads.
+        A video ID listed more than once is downloaded once and its path repeated."""
+        if not video_ids:
+            return []
+        os.makedirs(out_dir, exist_ok=True)
+        # Two workers on the same ID would write the same output and .part file at once
+        unique_ids = list(dict.fromkeys(video_ids))
+        paths = dict(zip(unique_ids, self._fan_out(
+            lambda vid: self.download_audio(vid, os.path.join(out_dir, vid), preferred_codec),
+            unique_ids, max_workers, downloads=True
+        )))
+        return [paths[vid] for vid in video_ids]
 
 
 def parse_youtube_url(url: str) -> Optional[Dict[str, str]]:
-    video_patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/v/([a-zA-Z0-9_-]{11})',
-    ]
-    for pattern in video_patterns:
-        m = re.search(pattern, url)
-        if m: return {'type': 'video', 'id': m.group(1)}
-    playlist_match = re.search(r'youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)', url)
-    if playlist_match: return {'type': 'playlist', 'id': playlist_match.group(1)}
-    playlist_in_video = re.search(r'[?&]list=([a-zA-Z0-9_-]+)', url)
-    if playlist_in_video: return {'type': 'playlist', 'id': playlist_in_video.group(1)}
-    channel_patterns = [
-        r'youtube\.com/channel/([a-zA-Z0-9_-]+)',
-        r'youtube\.com/(c/[a-zA-Z0-9_\.-]+)',
-        r'youtube\.com/(@[a-zA-Z0-9_\.-]+)',
-    ]
-    for pattern in channel_patterns:
-        m = re.search(pattern, url)
-        if m: return {'type': 'channel', 'id': m.group(1)}
+    url = url.strip()
+    result = _parse_youtube_link(url)
+    if result is None:
+        # Link inside other text: "<https://youtu.be/...>", quoted, "see https://..."
+        m = _EMBEDDED_URL_RE.search(url)
+        if m and m.group(0) != url:
+            result = _parse_youtube_link(m.group(0))
+    return result
+
+
+def _parse_youtube_link(url: str) -> Optional[Dict[str, str]]:
+    m = _URL_RE.match(url)
+    if m:
+        kind = m.lastgroup
+        return {'type': 'channel' if kind == 'handle' else kind, 'id': m.group(kind)}
+    # Allow scheme-less links like "youtube.com/watch?v=..."
+    try:
+        p = urlparse(url if url.startswith(('http://', 'https://', '//')) else '//' + url)
+    except ValueError:  # e.g. "[...]" read as a malformed IPv6 host
+        return None
+    host = (p.hostname or '').removeprefix('www.')
+    if host != 'youtu.be' and host != 'youtube.com' and not host.endswith('.youtube.com'):
+        return None
+    path = p.path
+    qs = parse_qs(p.query)
+
+    # Video: youtu.be/<id>, /watch?v=<id>, /embed/<id>, /v/<id>, /shorts/<id>, /live/<id>
+    if host == 'youtu.be':
+        vid = path[1:12]
+    elif path == '/watch':
+        vid = qs.get('v', [''])[0][:11]
+    elif path.startswith(('/embed/', '/v/', '/shorts/', '/live/')):
+        vid = path.split('/', 3)[2][:11]
+    else:
+        vid = ''
+    if _VIDEO_ID_RE.fullmatch(vid):
+        return {'type': 'video', 'id': vid}
+
+    m = _LIST_ID_RE.match(qs.get('list', [''])[0])
+    if m: return {'type': 'playlist', 'id': m.group(0)}
+
+    if host == 'youtu.be':
+        return None
+    # Channel: /channel/<id>, /c/<name>, /@<handle>
+    parts = path.split('/', 3)
+    first = parts[1] if len(parts) > 1 else ''
+    if first == 'channel' and len(parts) > 2:
+        m = _LIST_ID_RE.match(parts[2])
+        if m: return {'type': 'channel', 'id': m.group(0)}
+    elif first == 'c' and len(parts) > 2:
+        m = _HANDLE_RE.match(parts[2])
+        if m: return {'type': 'channel', 'id': 'c/' + m.group(0)}
+    elif first.startswith('@'):
+        m = _HANDLE_RE.match(first, 1)
+        if m: return {'type': 'channel', 'id': '@' + m.group(0)}
     return None